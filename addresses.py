@@ -0,0 +1,65 @@
+import ipaddress
+import re
+from typing import Optional, Tuple
+
+MAC_PATTERN = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
+MAC_SEPARATORS = re.compile(r'[:\-.]')
+
+
+def canonical_mac(mac: str) -> str:
+    """MAC 주소를 저장 형식(AA:BB:CC:DD:EE:FF)으로 바꿉니다"""
+    return mac.upper().replace("-", ":")
+
+
+def mac_to_int(mac: str) -> int:
+    """MAC 주소를 48비트 정수로 변환합니다 (형식이 잘못되면 ValueError)"""
+    if not MAC_PATTERN.match(mac):
+        raise ValueError(f"잘못된 MAC 주소입니다: {mac}")
+    return int(MAC_SEPARATORS.sub("", mac), 16)
+
+
+def int_to_mac(value: int) -> str:
+    """48비트 정수를 MAC 주소 문자열로 변환합니다"""
+    digits = "%012X" % value
+    return ":".join(digits[i:i + 2] for i in range(0, 12, 2))
+
+
+def mac_prefix_range(prefix: str) -> Tuple[int, int]:
+    """MAC 접두어(OUI 등)에 해당하는 48비트 정수 범위 [시작, 끝]
+
+    'AA:BB:CC', 'AA-BB-CC', 'AABBCC', 'AA:B' 처럼 16진수 자리 단위의 접두어를 받습니다.
+    """
+    digits = MAC_SEPARATORS.sub("", prefix)
+    if not 1 <= len(digits) <= 12 or not re.match(r'^[0-9A-Fa-f]+$', digits):
+        raise ValueError(f"잘못된 MAC 접두어입니다: {prefix}")
+    shift = 4 * (12 - len(digits))
+    start = int(digits, 16) << shift
+    return start, start + (1 << shift) - 1
+
+
+def ip_to_bin(ip: Optional[str]) -> Optional[bytes]:
+    """IP 주소를 16바이트 값으로 변환합니다 (IPv4는 IPv4-mapped IPv6, 잘못된 값은 None)
+
+    모든 주소를 같은 길이로 저장하므로 바이트 순서 비교가 주소 순서와 같습니다.
+    """
+    if not ip:
+        return None
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+    if address.version == 4:
+        address = ipaddress.IPv6Address(b"\x00" * 10 + b"\xff\xff" + address.packed)
+    return address.packed
+
+
+def bin_to_ip(value: bytes) -> str:
+    """ip_to_bin 값을 IP 주소 문자열로 되돌립니다"""
+    address = ipaddress.IPv6Address(bytes(value))
+    return str(address.ipv4_mapped or address)
+
+
+def cidr_range(cidr: str) -> Tuple[bytes, bytes]:
+    """CIDR 서브넷(예: 10.20.0.0/16)에 해당하는 ip_to_bin 범위 [시작, 끝]"""
+    network = ipaddress.ip_network(cidr.strip(), strict=False)
+    return ip_to_bin(str(network.network_address)), ip_to_bin(str(network.broadcast_address))
@@ -0,0 +1,87 @@
+"""장비 웹소켓(/ws/box/{mac}) 동시 유휴 연결 수와 연결당 메모리, 설정 전달 지연
+
+실행 중인 서버 워커 하나에 BENCH_CONNECTIONS개의 연결을 열어 둔 채로 측정합니다.
+서버 프로세스 번호(BENCH_SERVER_PID)를 주면 /proc에서 RSS 증가량을 읽어 연결당 메모리를 계산합니다.
+클라이언트/서버 모두 열린 파일 수 제한이 연결 수보다 커야 합니다 (ulimit -n).
+
+    uvicorn main:app --workers 1 --ws-per-message-deflate false &
+    BENCH_SERVER_PID=$! python benchmarks/bench_box_sockets.py
+"""
+import asyncio
+import json
+import os
+import time
+import urllib.request
+
+import websockets
+
+from common import bench_mac
+
+BASE_URL = os.getenv("BENCH_URL", "http://127.0.0.1:8000")
+CONNECTIONS = int(os.getenv("BENCH_CONNECTIONS", "10000"))
+SERVER_PID = os.getenv("BENCH_SERVER_PID")
+BATCH = 500  # 한 번에 여는 연결 수
+
+
+def server_rss_kb() -> int:
+    if not SERVER_PID:
+        return 0
+    with open("/proc/%s/status" % SERVER_PID) as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def request(method: str, path: str, body: dict = None) -> dict:
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(BASE_URL + path, data=data, method=method, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req) as response:
+        return json.loads(response.read())
+
+
+async def open_box(i: int):
+    url = BASE_URL.replace("http", "ws", 1) + "/ws/box/" + bench_mac(i)
+    return await websockets.connect(url, ping_interval=None, max_queue=4)
+
+
+async def main():
+    # 설정 전달 지연을 잴 장비 하나는 등록해 둠
+    probe_mac = bench_mac(CONNECTIONS + 1)
+    probe = request("PUT", "/computers/by-mac/" + probe_mac, {"main": "bench", "process": "PKG", "modifier": "bench"})
+
+    before = server_rss_kb()
+    started = time.perf_counter()
+    sockets = []
+    for start in range(0, CONNECTIONS, BATCH):
+        sockets += await asyncio.gather(*(open_box(i) for i in range(start, min(start + BATCH, CONNECTIONS))))
+    connect_seconds = time.perf_counter() - started
+    await asyncio.sleep(2)  # 연결 직후 설정 조회가 끝나 메모리가 안정될 때까지 대기
+    after = server_rss_kb()
+
+    print("connections=%d connect %.2f s (%.0f/s)" % (len(sockets), connect_seconds, len(sockets) / connect_seconds))
+    print("server", request("GET", "/computers/connections"))
+    if SERVER_PID:
+        print("server RSS +%d KB (%.1f KB/connection)" % (after - before, (after - before) / len(sockets)))
+
+    box = await open_box(CONNECTIONS + 1)
+    try:
+        await box.recv()  # 연결 시 현재 설정
+        latencies = []
+        loop = asyncio.get_event_loop()
+        for i in range(20):
+            started = time.perf_counter()
+            # asyncio.to_thread는 Python 3.9부터 있으므로 기본 스레드 풀에서 직접 실행
+            await loop.run_in_executor(None, request, "PUT", "/computers/%d" % probe["no"], {"notice": "bench %d" % i})
+            await box.recv()
+            latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+        print("config push (PUT -> box) median %.2f ms  max %.2f ms" % (latencies[len(latencies) // 2], latencies[-1]))
+    finally:
+        await box.close()
+
+    await asyncio.gather(*(ws.close() for ws in sockets))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""IOT BOX 1만 대 등록: 개별 POST(create_computer) 반복과 일괄 등록(create_computers_bulk) 비교
+
+    python benchmarks/bench_bulk_create.py
+"""
+import os
+import time
+
+from common import bench_mac, load_app
+
+COUNT = int(os.getenv("BENCH_COUNT", "10000"))
+# 기존 데이터와 겹치지 않는 MAC 대역
+SEQUENTIAL_BASE = 0x10_0000_0000
+BULK_BASE = 0x20_0000_0000
+
+
+def payload(base: int, i: int):
+    return {
+        "mac": bench_mac(base + i),
+        "ip": "10.99.%d.%d" % ((i >> 8) & 0xFF, i & 0xFF),
+        "main": "LINE%03d" % (i % 1000),
+        "process": "PKG",
+        "modifier": "bench",
+        "notice": None,
+    }
+
+
+def cleanup(app, base: int):
+    start, end = app.mac_to_int(bench_mac(base)), app.mac_to_int(bench_mac(base + COUNT - 1))
+    db = app.SessionLocal()
+    try:
+        db.query(app.EdgeComputer).filter(app.EdgeComputer.mac_int.between(start, end)).delete(
+            synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def main():
+    app = load_app()
+    cleanup(app, SEQUENTIAL_BASE)
+    cleanup(app, BULK_BASE)
+
+    db = app.SessionLocal()
+    try:
+        started = time.perf_counter()
+        for i in range(COUNT):
+            app.create_computer(app.EdgeComputerCreate(**payload(SEQUENTIAL_BASE, i)), db=db)
+        sequential = time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = app.create_computers_bulk([payload(BULK_BASE, i) for i in range(COUNT)], db=db)
+        bulk = time.perf_counter() - started
+    finally:
+        db.close()
+
+    created = sum(1 for result in results if result.status == "created")
+    print("boxes=%d (bulk created=%d)" % (COUNT, created))
+    print("sequential %8.2f s  (%6.2f ms/box)" % (sequential, sequential * 1000 / COUNT))
+    print("bulk       %8.2f s  (%6.2f ms/box)" % (bulk, bulk * 1000 / COUNT))
+
+    cleanup(app, SEQUENTIAL_BASE)
+    cleanup(app, BULK_BASE)
+
+
+if __name__ == "__main__":
+    main()
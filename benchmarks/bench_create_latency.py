@@ -0,0 +1,103 @@
+"""Edge Computer 등록 1건 지연: 이전 방식(커밋 2회 + refresh)과 UnitOfWork(커밋 1회) 비교
+
+history.py 앱 기준입니다. 이전 방식은 장비 커밋 -> db.refresh(SELECT) -> 생성 이력 -> 다시 커밋이며
+여기서 그대로 재현해 같은 DB에서 번갈아 측정합니다. 커밋마다의 fsync 비용이 차이를 만들므로
+운영과 같은 MariaDB에서 실행한 결과만 비교에 쓰세요 (출력 첫 줄에 측정한 DB 서버가 나옵니다).
+
+    python benchmarks/bench_create_latency.py
+"""
+import os
+import time
+
+os.environ.setdefault("BENCH_APP", "history")
+
+from common import bench_mac, load_app
+
+COUNT = int(os.getenv("BENCH_COUNT", "2000"))
+# 기존 데이터와 겹치지 않는 MAC 대역
+TWO_COMMIT_BASE = 0x30_0000_0000
+UNIT_OF_WORK_BASE = 0x40_0000_0000
+
+
+def payload(base: int, i: int):
+    return {
+        "mac": bench_mac(base + i),
+        "ip": "10.98.%d.%d" % ((i >> 8) & 0xFF, i & 0xFF),
+        "main": "LINE%03d" % (i % 1000),
+        "process": "PKG",
+        "modifier": "bench",
+        "notice": None,
+    }
+
+
+def two_commit_create(app, db, computer):
+    """UnitOfWork 이전의 create_computer"""
+    mac_int = app.mac_to_int(computer.mac)
+    existing = db.query(app.EdgeComputer.no).filter(app.EdgeComputer.mac_int == mac_int).first()
+    assert existing is None
+    db_computer = app.EdgeComputer(**computer.dict(), mac_int=mac_int, ip_bin=app.ip_to_bin(computer.ip))
+    db.add(db_computer)
+    db.flush()
+    app.record_changes(db, [db_computer.no])
+    db.commit()
+    db.refresh(db_computer)
+    db.add(app.ModificationHistory(
+        computer_no=db_computer.no, action="CREATE", modifier=computer.modifier,
+        description=f"새 Edge Computer 등록: MAC={computer.mac}, MAIN={computer.main}"
+    ))
+    db.commit()
+    app.on_computer_saved(db_computer, created=True)
+    app.bump_fleet_version()
+    return db_computer
+
+
+def cleanup(app, base: int):
+    start, end = app.mac_to_int(bench_mac(base)), app.mac_to_int(bench_mac(base + COUNT - 1))
+    db = app.SessionLocal()
+    try:
+        nos = [no for (no,) in db.query(app.EdgeComputer.no).filter(app.EdgeComputer.mac_int.between(start, end))]
+        if nos:
+            db.query(app.ModificationHistory).filter(app.ModificationHistory.computer_no.in_(nos)).delete(
+                synchronize_session=False)
+            db.query(app.EdgeComputer).filter(app.EdgeComputer.no.in_(nos)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def summary(samples):
+    samples.sort()
+    return "median %6.2f ms  p95 %6.2f ms" % (samples[len(samples) // 2], samples[int(len(samples) * 0.95)])
+
+
+def main():
+    app = load_app()
+    cleanup(app, TWO_COMMIT_BASE)
+    cleanup(app, UNIT_OF_WORK_BASE)
+
+    two_commit, unit_of_work = [], []
+    db = app.SessionLocal()
+    try:
+        # 번갈아 실행해 DB 상태(캐시, 테이블 크기) 차이가 한쪽에 몰리지 않게 함
+        for i in range(COUNT):
+            started = time.perf_counter()
+            two_commit_create(app, db, app.EdgeComputerCreate(**payload(TWO_COMMIT_BASE, i)))
+            two_commit.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            app.create_computer(app.EdgeComputerCreate(**payload(UNIT_OF_WORK_BASE, i)), db=db)
+            unit_of_work.append((time.perf_counter() - started) * 1000)
+    finally:
+        db.close()
+
+    print("server %s %s" % (app.engine.dialect.name, ".".join(map(str, app.engine.dialect.server_version_info or ()))))
+    print("creates=%d each" % COUNT)
+    print("two commits + refresh  %s" % summary(two_commit))
+    print("unit of work (1 commit) %s" % summary(unit_of_work))
+
+    cleanup(app, TWO_COMMIT_BASE)
+    cleanup(app, UNIT_OF_WORK_BASE)
+
+
+if __name__ == "__main__":
+    main()
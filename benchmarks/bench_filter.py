@@ -0,0 +1,53 @@
+"""열 단위 배열(FleetColumns) 다중 조건 필터 응답 시간 (DB 없이 100만 건)
+
+    python benchmarks/bench_filter.py
+"""
+import os
+from datetime import datetime, timedelta
+
+from common import timed
+
+from fleet_columns import ColumnRow, FleetColumns, ipv4_range
+from addresses import cidr_range
+
+SIZES = [int(size) for size in os.getenv("BENCH_SIZES", "100000,1000000").split(",")]
+
+
+def build(size: int) -> FleetColumns:
+    now = datetime.utcnow()
+    columns = FleetColumns()
+    columns.load((
+        ColumnRow(
+            i + 1, 0x020000000000 + i,
+            "10.%d.%d.%d" % ((i >> 16) & 0xFF, (i >> 8) & 0xFF, i & 0xFF),
+            "A%05dA" % (i % 100000),
+            ("PKG", "TEST", "SPKG")[i % 3],
+            "bench%d" % (i % 20),
+            now - timedelta(seconds=i % 3600) if i % 50 else None,
+        )
+        for i in range(size)
+    ), version=0)
+    return columns
+
+
+def main():
+    subnet = ipv4_range(*cidr_range("10.3.0.0/16"))
+    cases = {
+        "process": dict(process="PKG"),
+        "process+main": dict(process="PKG", main_prefix="A012"),
+        "subnet+stale": dict(ip_range=subnet, seen_before=datetime.utcnow() - timedelta(minutes=30)),
+        "all four": dict(
+            process="TEST", main_prefix="A0", ip_range=subnet,
+            seen_before=datetime.utcnow() - timedelta(minutes=10)
+        ),
+    }
+    for size in SIZES:
+        columns = build(size)
+        print("rows=%d" % size)
+        for label, predicates in cases.items():
+            ms = timed(lambda: columns.filter(**predicates))
+            print("  %-14s %8.2f ms  matched=%d" % (label, ms, len(columns.filter(**predicates))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""OFFSET 페이지네이션과 키셋 페이지네이션의 1페이지 / 1000페이지 응답 시간 비교
+
+    BENCH_ROWS=1000000 python benchmarks/bench_pagination.py
+"""
+import os
+
+from common import load_app, seed_computers, timed
+
+ROWS = int(os.getenv("BENCH_ROWS", "1000000"))
+PAGE_SIZE = 100
+DEEP_PAGE = 1000
+
+
+def main():
+    app = load_app()
+    seed_computers(app, ROWS)
+    db = app.SessionLocal()
+    try:
+        # 1000페이지 시작 위치의 커서 (측정 대상 아님)
+        boundary = db.query(app.EdgeComputer.no).order_by(app.EdgeComputer.no) \
+            .offset((DEEP_PAGE - 1) * PAGE_SIZE - 1).limit(1).scalar()
+        deep_cursor = app.encode_cursor({"order": "no", "no": boundary})
+
+        results = {
+            "offset page 1": timed(lambda: app.read_computers(skip=0, limit=PAGE_SIZE, db=db)),
+            "offset page %d" % DEEP_PAGE: timed(
+                lambda: app.read_computers(skip=(DEEP_PAGE - 1) * PAGE_SIZE, limit=PAGE_SIZE, db=db)),
+            "keyset page 1": timed(lambda: app.read_computers(cursor="", limit=PAGE_SIZE, db=db)),
+            "keyset page %d" % DEEP_PAGE: timed(
+                lambda: app.read_computers(cursor=deep_cursor, limit=PAGE_SIZE, db=db)),
+        }
+    finally:
+        db.close()
+
+    print("rows=%d page_size=%d" % (ROWS, PAGE_SIZE))
+    for name, ms in results.items():
+        print("%-20s %8.2f ms" % (name, ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""검색 백엔드(like / trigram / fulltext) 응답 시간 비교 (10만, 100만 건)
+
+    python benchmarks/bench_search.py
+"""
+import os
+
+from sqlalchemy import text
+
+from common import load_app, seed_computers, timed
+
+SIZES = [int(size) for size in os.getenv("BENCH_SIZES", "100000,1000000").split(",")]
+QUERIES = ["PKG", "A01234A", "line 42", "02:00:00:01", "10.1.2."]
+LIMIT = 100
+
+
+def main():
+    app = load_app()
+    for size in SIZES:
+        seed_computers(app, size)
+        with app.engine.begin() as conn:
+            conn.execute(text(
+                "CREATE FULLTEXT INDEX IF NOT EXISTS ft_edge_computers_text "
+                "ON edge_computers (main, process, modifier, notice)"
+            ))
+        app.SEARCH_BACKEND = "trigram"
+        app.load_search_index()
+
+        db = app.SessionLocal()
+        try:
+            print("rows=%d limit=%d" % (size, LIMIT))
+            for q in QUERIES:
+                line = ["%-14s" % q]
+                for backend in ("like", "trigram", "fulltext"):
+                    search = app.SEARCH_BACKENDS[backend]
+                    ms = timed(lambda: search(db, q, LIMIT), repeat=5)
+                    line.append("%s %8.2f ms" % (backend, ms))
+                print("  ".join(line))
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
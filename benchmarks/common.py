@@ -0,0 +1,59 @@
+import importlib
+import os
+import sys
+import time
+from datetime import datetime
+
+from sqlalchemy import func, insert
+
+# 저장소 루트의 main.py / history.py를 불러올 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 측정 대상 앱 (main 또는 history)
+BENCH_APP = os.getenv("BENCH_APP", "main")
+
+
+def load_app():
+    """측정 대상 앱 모듈을 불러옵니다 (실제 MariaDB에 연결됩니다)"""
+    return importlib.import_module(BENCH_APP)
+
+
+def bench_mac(i: int) -> str:
+    """벤치마크용 MAC 주소 (02: 로컬 관리 주소 대역)"""
+    return "02:" + ":".join("%02X" % ((i >> shift) & 0xFF) for shift in (32, 24, 16, 8, 0))
+
+
+def seed_computers(app, rows: int, batch: int = 10000):
+    """edge_computers 테이블을 rows 건까지 채웁니다 (이미 있으면 부족한 만큼만)"""
+    db = app.SessionLocal()
+    try:
+        existing = db.query(func.count(app.EdgeComputer.no)).scalar()
+        now = datetime.utcnow()
+        for start in range(existing, rows, batch):
+            db.execute(insert(app.EdgeComputer), [
+                {
+                    "mac": bench_mac(i),
+                    "ip": "10.%d.%d.%d" % ((i >> 16) & 0xFF, (i >> 8) & 0xFF, i & 0xFF),
+                    "main": "A%05dA" % (i % 100000),
+                    "process": ("PKG", "TEST", "SPKG")[i % 3],
+                    "modifier": "bench",
+                    "notice": "line %d" % (i % 500),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(start, min(start + batch, rows))
+            ])
+            db.commit()
+    finally:
+        db.close()
+
+
+def timed(fn, repeat: int = 20):
+    """fn을 repeat번 실행해 중앙값(ms)을 반환합니다"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
@@ -0,0 +1,194 @@
+import asyncio
+import json
+from collections import deque
+from typing import Dict, Optional, Set, Tuple
+
+
+class BoxConnection:
+    """IOT BOX 한 대의 웹소켓 연결 (유휴 연결이 많으므로 __slots__로 크기를 줄임)"""
+
+    __slots__ = ("websocket", "mac_int", "pending", "sender", "config")
+
+    def __init__(self, websocket, mac_int: int):
+        self.websocket = websocket
+        self.mac_int = mac_int
+        self.pending = deque()  # 보낼 메시지 (최대 buffer_size개)
+        self.sender: Optional[asyncio.Task] = None  # 보낼 메시지가 있을 때만 존재
+        self.config: Optional[dict] = None  # 마지막으로 보낸 설정 (같은 설정은 다시 보내지 않음)
+
+
+async def close_quietly(websocket, code: int):
+    try:
+        await websocket.close(code=code)
+    except Exception:  # 이미 끊긴 연결
+        pass
+
+
+class BoxChannels:
+    """MAC(정수)별 장비 웹소켓 연결 목록과 서버 -> 장비 메시지 전달
+
+    보낼 메시지가 있을 때만 연결별 전송 작업을 만들므로 유휴 연결은 수신 대기 코루틴
+    하나만 차지합니다. 연결별 대기 메시지는 buffer_size개까지이며 넘치면 그 연결을
+    끊습니다 (장비가 다시 연결하면 현재 설정을 처음부터 받음).
+    push_config는 쓰기 핸들러(스레드 풀)에서 호출되므로 이벤트 루프로 넘겨 처리합니다.
+    """
+
+    REPLACED = 4000  # 같은 MAC이 새로 연결해 이전 연결을 닫음
+    OVERFLOW = 1013  # 메시지를 따라오지 못해 닫음 (다시 연결)
+
+    def __init__(self, buffer_size: int = 32):
+        self.buffer_size = buffer_size
+        self._connections: Dict[int, BoxConnection] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set[asyncio.Task] = set()
+        self.token: Optional[int] = None  # 다른 워커의 변경을 확인한 마지막 변경 로그 번호
+        self.dropped = 0
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    def __len__(self):
+        return len(self._connections)
+
+    def __contains__(self, mac_int) -> bool:
+        return mac_int in self._connections
+
+    def connect(self, mac_int: int, websocket) -> Tuple[BoxConnection, Optional[BoxConnection]]:
+        """연결을 등록하고 (새 연결, 같은 MAC의 이전 연결)을 반환합니다 (이전 연결은 호출한 쪽에서 닫음)"""
+        connection = BoxConnection(websocket, mac_int)
+        previous = self._connections.get(mac_int)
+        self._connections[mac_int] = connection
+        return connection, previous
+
+    def disconnect(self, connection: BoxConnection):
+        if self._connections.get(connection.mac_int) is connection:
+            del self._connections[connection.mac_int]
+        connection.pending.clear()
+
+    def push_config(self, mac_int: int, config: dict):
+        """연결된 장비에 설정을 보냅니다 (어느 스레드에서나 호출 가능)"""
+        if self._loop is None or mac_int not in self._connections:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._push_config, mac_int, config)
+        except RuntimeError:  # 이벤트 루프 종료 중
+            pass
+
+    def send_config(self, connection: BoxConnection, config: dict):
+        """설정이 마지막으로 보낸 것과 다르면 보냅니다 (이벤트 루프에서 호출)"""
+        if connection.config == config:
+            return
+        connection.config = config
+        self._enqueue(connection, json.dumps({"type": "config", **config}, ensure_ascii=False))
+
+    def _push_config(self, mac_int: int, config: dict):
+        connection = self._connections.get(mac_int)
+        if connection is not None:
+            self.send_config(connection, config)
+
+    def _enqueue(self, connection: BoxConnection, message: str):
+        if len(connection.pending) >= self.buffer_size:
+            self._drop(connection)
+            return
+        connection.pending.append(message)
+        if connection.sender is None:
+            connection.sender = asyncio.ensure_future(self._send(connection))
+
+    async def _send(self, connection: BoxConnection):
+        try:
+            while connection.pending:
+                await connection.websocket.send_text(connection.pending.popleft())
+        except Exception:
+            self._drop(connection)
+        finally:
+            connection.sender = None
+
+    def _drop(self, connection: BoxConnection):
+        """따라오지 못하거나 보내기에 실패한 연결을 끊습니다"""
+        self.disconnect(connection)
+        self.dropped += 1
+        task = asyncio.ensure_future(close_quietly(connection.websocket, self.OVERFLOW))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def stats(self) -> dict:
+        return {"connected": len(self._connections), "dropped": self.dropped}
+
+
+class _Waiting:
+    __slots__ = ("event", "config", "count")
+
+    def __init__(self):
+        self.event = asyncio.Event()
+        self.config: Optional[dict] = None
+        self.count = 0
+
+
+class ConfigWaiters:
+    """MAC(정수)별로 설정 변경을 기다리는 long-poll 요청
+
+    같은 MAC을 기다리는 요청은 asyncio.Event 하나를 함께 기다리고, 변경을 알리면 새 설정을
+    Event와 함께 넘겨주므로 깨어난 요청은 DB를 읽지 않고 바로 응답합니다.
+    DB를 읽기 전에 register로 먼저 등록해야 읽은 직후의 변경을 놓치지 않습니다.
+    notify는 쓰기 핸들러(스레드 풀)에서 호출되므로 이벤트 루프로 넘겨 처리합니다.
+    """
+
+    def __init__(self):
+        self._waiting: Dict[int, _Waiting] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    def __len__(self):
+        return len(self._waiting)
+
+    def __contains__(self, mac_int) -> bool:
+        return mac_int in self._waiting
+
+    def register(self, mac_int: int) -> _Waiting:
+        waiting = self._waiting.get(mac_int)
+        if waiting is None:
+            waiting = self._waiting[mac_int] = _Waiting()
+        waiting.count += 1
+        return waiting
+
+    def release(self, mac_int: int, waiting: _Waiting):
+        waiting.count -= 1
+        if waiting.count == 0 and self._waiting.get(mac_int) is waiting:
+            del self._waiting[mac_int]
+
+    async def wait(self, mac_int: int, waiting: _Waiting, version: int, timeout: float) -> Optional[dict]:
+        """version보다 새 설정을 받을 때까지 기다립니다 (시간이 지나면 None, waiting은 이 안에서 해제)"""
+        deadline = asyncio.get_running_loop().time() + timeout
+        try:
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    return None
+                try:
+                    await asyncio.wait_for(waiting.event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return None
+                if waiting.config["version"] > version:
+                    return waiting.config
+                # 알림받은 설정이 새것이 아니면 (다른 워커 변경 확인 등) 다시 기다림
+                self.release(mac_int, waiting)
+                waiting = self.register(mac_int)
+        finally:
+            self.release(mac_int, waiting)
+
+    def notify(self, mac_int: int, config: dict):
+        """기다리는 요청에 새 설정을 넘깁니다 (어느 스레드에서나 호출 가능)"""
+        if self._loop is None or mac_int not in self._waiting:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._notify, mac_int, config)
+        except RuntimeError:  # 이벤트 루프 종료 중
+            pass
+
+    def _notify(self, mac_int: int, config: dict):
+        waiting = self._waiting.pop(mac_int, None)
+        if waiting is not None:
+            waiting.config = config
+            waiting.event.set()
@@ -0,0 +1,63 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def body_etag(body: bytes) -> str:
+    """응답 본문의 해시로 만든 강한 ETag"""
+    return '"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+
+
+def state_etag(*parts, weak: bool = False) -> str:
+    """변경 카운터 등 상태 값으로 만든 ETag (본문을 만들지 않고 계산)"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return ('W/"%s"' if weak else '"%s"') % digest
+
+
+def http_date(value: datetime) -> str:
+    """UTC naive datetime을 HTTP 날짜 형식으로 바꿉니다"""
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def opaque_tag(tag: str) -> str:
+    """약한 비교용으로 W/ 접두어를 뗀 ETag"""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """If-None-Match(약한 비교) 또는 If-Modified-Since 조건으로 304를 보낼 수 있는지
+
+    If-None-Match가 있으면 If-Modified-Since는 무시합니다 (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {opaque_tag(tag) for tag in if_none_match.split(",")}
+        return opaque_tag(etag) in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+    return False
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> dict:
+    """검증 헤더 (no-cache: 브라우저가 캐시한 응답을 매번 ETag로 재검증)"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
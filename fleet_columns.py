@@ -0,0 +1,257 @@
+import ipaddress
+import threading
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 컬럼 저장소를 쓰지 않음
+    np = None
+
+EPOCH = datetime(1970, 1, 1)
+NEVER = -1  # last_seen이 없는 행
+
+
+class ColumnRow(NamedTuple):
+    no: int
+    mac_int: Optional[int]
+    ip: Optional[str]
+    main: Optional[str]
+    process: Optional[str]
+    modifier: Optional[str]
+    last_seen: Optional[datetime]
+
+
+def _micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return NEVER
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def _ipv4(ip: Optional[str]) -> Optional[int]:
+    try:
+        address = ipaddress.ip_address(ip) if ip else None
+    except ValueError:
+        return None
+    if address is not None and address.version == 6:
+        address = address.ipv4_mapped
+    return int(address) if address is not None else None
+
+
+class Dictionary:
+    """문자열 컬럼의 사전 인코딩 (값 -> 정수 코드, 0은 NULL)"""
+
+    def __init__(self):
+        self.values: List[Optional[str]] = [None]
+        self.codes: Dict[str, int] = {}
+        self._sorted: Optional[Tuple[List[str], List[int]]] = None  # 소문자 값 정렬 (접두어 검색용)
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+            self._sorted = None
+        return code
+
+    def matching(self, predicate) -> List[int]:
+        """조건을 만족하는 값의 코드 목록 (사전 크기만큼만 비교)"""
+        return [code for value, code in self.codes.items() if predicate(value)]
+
+    def prefixed(self, prefix: str) -> List[int]:
+        """소문자 기준으로 prefix로 시작하는 값의 코드 목록 (정렬된 사전에서 이진 탐색)"""
+        if self._sorted is None:
+            pairs = sorted((value.lower(), code) for value, code in self.codes.items())
+            self._sorted = [value for value, _ in pairs], [code for _, code in pairs]
+        values, codes = self._sorted
+        prefix = prefix.lower()
+        start = bisect_left(values, prefix)
+        end = start
+        while end < len(values) and values[end].startswith(prefix):
+            end += 1
+        return codes[start:end]
+
+
+class FleetColumns:
+    """장비 목록의 열 단위 배열 사본 (numpy)
+
+    MAC은 uint64, IPv4는 uint32, main/process/modifier는 사전 인코딩한 int32 코드,
+    last_seen은 epoch 마이크로초 int64 배열로 보관합니다. 여러 조건 필터는 각 열의
+    불리언 마스크를 AND 해서 계산하므로 행 수가 많아도 몇 밀리초 안에 끝납니다.
+    version은 FleetSnapshot과 같은 방식으로 DB 변경 카운터를 따라가고, 다시 읽는 동안의
+    put/remove도 FleetSnapshot처럼 기록해 두었다가 읽은 행 위에 다시 반영합니다.
+    """
+
+    STRING_COLUMNS = ("main", "process", "modifier")
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise ValueError("컬럼 저장소에는 numpy 패키지가 필요합니다")
+        self._lock = threading.Lock()
+        self._capacity = capacity
+        self._positions: Dict[int, int] = {}
+        self._size = 0
+        self._dead = 0
+        self._allocate(capacity)
+        self.dictionaries = {column: Dictionary() for column in self.STRING_COLUMNS}
+        self.version: Optional[int] = None
+        self.stale = False
+        self._pending: Optional[List[Tuple[int, Optional[ColumnRow]]]] = None  # 읽는 동안의 (no, 행 또는 삭제)
+
+    def _allocate(self, capacity: int):
+        self.no = np.zeros(capacity, dtype=np.int64)
+        self.mac = np.zeros(capacity, dtype=np.uint64)
+        self.ip = np.zeros(capacity, dtype=np.uint32)
+        self.has_ip = np.zeros(capacity, dtype=bool)
+        self.live = np.zeros(capacity, dtype=bool)
+        self.last_seen = np.full(capacity, NEVER, dtype=np.int64)
+        self.codes = {column: np.zeros(capacity, dtype=np.int32) for column in self.STRING_COLUMNS}
+
+    def _arrays(self):
+        return [self.no, self.mac, self.ip, self.has_ip, self.live, self.last_seen, *self.codes.values()]
+
+    def _grow(self):
+        capacity = self._capacity * 2
+        old = self._arrays()
+        self._allocate(capacity)
+        for new, array in zip(self._arrays(), old):
+            new[:self._size] = array[:self._size]
+        self._capacity = capacity
+
+    def __len__(self):
+        return len(self._positions)
+
+    @property
+    def loaded(self) -> bool:
+        return self.version is not None
+
+    def begin_load(self):
+        """DB에서 변경 카운터와 행을 읽기 직전에 호출합니다 (이후의 put/remove를 기록)"""
+        with self._lock:
+            self._pending = []
+
+    def load(self, rows: Iterable[ColumnRow], version: int):
+        """전체 행으로 다시 만듭니다 (begin_load 이후의 put/remove는 다시 반영하고 stale로 둠)"""
+        rows = list(rows)
+        with self._lock:
+            self._capacity = max(1024, len(rows))
+            self._allocate(self._capacity)
+            self._positions = {}
+            self._size = self._dead = 0
+            self.dictionaries = {column: Dictionary() for column in self.STRING_COLUMNS}
+            for row in rows:
+                self._put(row)
+            pending, self._pending = self._pending or [], None
+            for no, row in pending:
+                if row is None:
+                    self._remove(no)
+                else:
+                    self._put(row)
+            self.version = version
+            self.stale = bool(pending)
+
+    def put(self, row: ColumnRow):
+        with self._lock:
+            self._put(row)
+            if self._pending is not None:
+                self._pending.append((row.no, row))
+
+    def remove(self, no: int):
+        with self._lock:
+            self._remove(no)
+            if self._pending is not None:
+                self._pending.append((no, None))
+
+    def _remove(self, no: int):
+        position = self._positions.pop(no, None)
+        if position is None:
+            return
+        self.live[position] = False
+        self._dead += 1
+        if self._dead > 1024 and self._dead * 2 > self._size:
+            self._compact()
+
+    def set_last_seen(self, pairs: Iterable[Tuple[int, datetime]]):
+        """(no, last_seen) 목록의 last_seen만 갱신합니다 (이미 더 최근 값이면 그대로 둠)"""
+        with self._lock:
+            for no, seen_at in pairs:
+                position = self._positions.get(no)
+                if position is not None:
+                    self.last_seen[position] = max(self.last_seen[position], _micros(seen_at))
+
+    def advance(self, version: int):
+        """이 프로세스의 쓰기로 올라간 변경 카운터 값을 기록합니다 (FleetSnapshot.advance와 같음)"""
+        with self._lock:
+            if self.version is not None and version == self.version + 1:
+                self.version = version
+            elif self.version is None or version > self.version:
+                self.stale = True
+
+    def _put(self, row: ColumnRow):
+        position = self._positions.get(row.no)
+        if position is None:
+            if self._size == self._capacity:
+                self._grow()
+            position = self._positions[row.no] = self._size
+            self._size += 1
+        ip = _ipv4(row.ip)
+        self.no[position] = row.no
+        self.mac[position] = row.mac_int if row.mac_int is not None else 0
+        self.ip[position] = ip or 0
+        self.has_ip[position] = ip is not None
+        self.live[position] = True
+        self.last_seen[position] = _micros(row.last_seen)
+        for column in self.STRING_COLUMNS:
+            self.codes[column][position] = self.dictionaries[column].encode(getattr(row, column))
+
+    def _compact(self):
+        keep = np.flatnonzero(self.live[:self._size])
+        for array in self._arrays():
+            array[:len(keep)] = array[keep]
+        self._size = len(keep)
+        self._dead = 0
+        self.live[self._size:] = False
+        self._positions = {int(no): position for position, no in enumerate(self.no[:self._size])}
+
+    def _in_codes(self, column: str, size: int, codes: List[int]) -> "np.ndarray":
+        values = self.codes[column][:size]
+        if len(codes) == 1:
+            return values == codes[0]
+        return np.isin(values, codes)
+
+    def filter(self, process: Optional[str] = None, main_prefix: Optional[str] = None,
+               modifier: Optional[str] = None, ip_range: Optional[Tuple[int, int]] = None,
+               seen_before: Optional[datetime] = None) -> "np.ndarray":
+        """조건을 모두 만족하는 행의 no 배열 (no 오름차순)
+
+        ip_range는 IPv4 정수 범위 [시작, 끝], seen_before를 주면 그 시각 이전에
+        마지막으로 확인되었거나 한 번도 확인되지 않은 행을 찾습니다.
+        """
+        with self._lock:
+            size = self._size
+            mask = self.live[:size].copy()
+            # 문자열 조건은 DB 콜레이션처럼 대소문자를 구분하지 않고 사전에서 코드를 찾아 비교
+            for column, wanted in (("process", process), ("modifier", modifier)):
+                if wanted is not None:
+                    codes = self.dictionaries[column].matching(lambda value: value.lower() == wanted.lower())
+                    mask &= self._in_codes(column, size, codes)
+            if main_prefix is not None:
+                mask &= self._in_codes("main", size, self.dictionaries["main"].prefixed(main_prefix))
+            if ip_range is not None:
+                start, end = ip_range
+                ips = self.ip[:size]
+                mask &= self.has_ip[:size] & (ips >= start) & (ips <= end)
+            if seen_before is not None:
+                mask &= self.last_seen[:size] < _micros(seen_before)
+            return np.sort(self.no[:size][mask])
+
+
+def ipv4_range(start: bytes, end: bytes) -> Tuple[int, int]:
+    """cidr_range 결과(ip_bin 범위)를 IPv4 정수 범위로 바꿉니다 (IPv4 서브넷이 아니면 ValueError)"""
+    first, last = ipaddress.IPv6Address(start).ipv4_mapped, ipaddress.IPv6Address(end).ipv4_mapped
+    if first is None or last is None:
+        raise ValueError("IPv4 서브넷만 지원합니다")
+    return int(first), int(last)
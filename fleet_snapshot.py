@@ -0,0 +1,135 @@
+import threading
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SnapshotRow(NamedTuple):
+    no: int
+    values: Dict[str, Any]  # 컬럼 값 (필터/정렬용)
+    json: bytes  # 직렬화된 응답 JSON (목록 응답을 만들 때 그대로 이어 붙임)
+
+
+class FleetSnapshot:
+    """전체 장비 목록을 담는 프로세스 내 스냅샷
+
+    version은 이 스냅샷이 반영한 DB 변경 카운터 값입니다. 이 프로세스의 쓰기는
+    put/remove로 바로 반영한 뒤 advance로 카운터를 따라가고, 다른 워커의 쓰기로
+    카운터가 건너뛰면 stale이 되어 다시 읽어야 합니다.
+    다시 읽는 동안(begin_load 이후 load 전)의 put/remove는 기록해 두었다가 읽은 행 위에
+    다시 반영하므로, DB를 읽은 뒤 커밋된 이 프로세스의 쓰기가 교체로 사라지지 않습니다.
+    정렬 결과와 직렬화된 응답은 내용이 바뀔 때까지 요청 사이에 재사용됩니다.
+    """
+
+    def __init__(self, max_responses: int = 256):
+        self.max_responses = max_responses
+        self._lock = threading.Lock()
+        self._rows: Dict[int, SnapshotRow] = {}
+        self._orders: Dict[str, Tuple[List[SnapshotRow], List[tuple]]] = {}
+        self._responses: Dict[Hashable, Any] = {}
+        self._revision = 0  # 내용이 바뀔 때마다 증가
+        self.version: Optional[int] = None  # None이면 아직 읽지 않음
+        self.stale = False
+        self.loads = 0
+        self._pending: Optional[List[Tuple[int, Optional[SnapshotRow]]]] = None  # 읽는 동안의 (no, 행 또는 삭제)
+
+    def __len__(self):
+        return len(self._rows)
+
+    @property
+    def loaded(self) -> bool:
+        return self.version is not None
+
+    def begin_load(self):
+        """DB에서 변경 카운터와 행을 읽기 직전에 호출합니다 (이후의 put/remove를 기록)"""
+        with self._lock:
+            self._pending = []
+
+    def load(self, rows: Iterable[SnapshotRow], version: int):
+        """스냅샷 전체를 교체합니다
+
+        begin_load 이후의 put/remove를 읽은 행 위에 다시 반영합니다. 그 쓰기가 읽은 행보다
+        오래된 값일 수도 있으므로(다른 워커가 그 사이 같은 행을 수정) 이 경우 stale로 두어
+        다음 확인 때 한 번 더 읽게 합니다.
+        """
+        rows = {row.no: row for row in rows}
+        with self._lock:
+            pending, self._pending = self._pending or [], None
+            for no, row in pending:
+                if row is None:
+                    rows.pop(no, None)
+                else:
+                    rows[no] = row
+            self._rows = rows
+            self._changed()
+            self.version = version
+            self.stale = bool(pending)
+            self.loads += 1
+
+    def put(self, row: SnapshotRow):
+        with self._lock:
+            self._rows[row.no] = row
+            if self._pending is not None:
+                self._pending.append((row.no, row))
+            self._changed()
+
+    def remove(self, no: int):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((no, None))
+            if self._rows.pop(no, None) is not None:
+                self._changed()
+
+    def advance(self, version: int):
+        """이 프로세스의 쓰기로 올라간 변경 카운터 값을 기록합니다
+
+        바로 다음 값이 아니면 그 사이 다른 워커의 쓰기가 있었던 것이므로 stale로 표시합니다.
+        """
+        with self._lock:
+            if self.version is not None and version == self.version + 1:
+                self.version = version
+            elif self.version is None or version > self.version:
+                self.stale = True
+
+    def get(self, no: int) -> Optional[SnapshotRow]:
+        return self._rows.get(no)
+
+    def ordered(self, order: str) -> Tuple[List[SnapshotRow], List[tuple]]:
+        """(order 값, no) 순으로 정렬한 행과 정렬 키 목록 (bisect용, 바뀔 때까지 재사용)"""
+        with self._lock:
+            cached = self._orders.get(order)
+            if cached is None:
+                if order == "no":
+                    rows = sorted(self._rows.values(), key=lambda row: row.no)
+                    keys = [(row.no,) for row in rows]
+                else:
+                    rows = sorted(self._rows.values(), key=lambda row: (row.values[order], row.no))
+                    keys = [(row.values[order], row.no) for row in rows]
+                cached = self._orders[order] = (rows, keys)
+            return cached
+
+    def response(self, key: Hashable, build: Callable[[], T]) -> T:
+        """key에 해당하는 직렬화된 응답 (스냅샷이 바뀔 때까지 재사용)"""
+        body = self._responses.get(key)
+        if body is None:
+            revision = self._revision
+            body = build()
+            with self._lock:
+                if revision != self._revision:
+                    return body
+                if len(self._responses) >= self.max_responses:
+                    self._responses.clear()
+                self._responses[key] = body
+        return body
+
+    def _changed(self):
+        self._revision += 1
+        self._orders = {}
+        self._responses = {}
+
+
+def page_after(rows: List[SnapshotRow], keys: List[tuple], position: Optional[tuple], limit: int):
+    """정렬된 행에서 position 다음부터 limit개와 다음 페이지 존재 여부를 반환합니다"""
+    start = bisect_right(keys, position) if position is not None else 0
+    return rows[start:start + limit], start + limit < len(rows)
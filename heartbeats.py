@@ -0,0 +1,41 @@
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+# mac_int -> (마지막 수신 시각, 보고된 IP)
+PendingHeartbeats = Dict[int, Tuple[datetime, Optional[str]]]
+
+
+class HeartbeatTable:
+    """장비별 최근 heartbeat를 모아 두는 메모리 테이블
+
+    같은 장비의 heartbeat는 마지막 값 하나로 합쳐지므로 flush 주기 동안
+    몇 번을 받든 DB에는 장비당 한 행만 반영됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: PendingHeartbeats = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def record(self, mac_int: int, seen_at: datetime, ip: Optional[str]):
+        """heartbeat 한 건을 기록합니다 (IP가 없으면 이전에 받은 IP 유지)"""
+        with self._lock:
+            previous = self._pending.get(mac_int)
+            if ip is None and previous is not None:
+                ip = previous[1]
+            self._pending[mac_int] = (seen_at, ip)
+
+    def drain(self) -> PendingHeartbeats:
+        """모인 heartbeat를 꺼내고 테이블을 비웁니다"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, pending: PendingHeartbeats):
+        """flush에 실패한 heartbeat를 되돌립니다 (그 사이 받은 더 새로운 값은 유지)"""
+        with self._lock:
+            for mac_int, entry in pending.items():
+                self._pending.setdefault(mac_int, entry)
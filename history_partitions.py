@@ -0,0 +1,162 @@
+from datetime import date, datetime
+from typing import Iterable, List, NamedTuple, Optional
+
+from sqlalchemy import text
+
+# 아직 만들지 않은 달의 이력을 받는 마지막 파티션 (항상 비어 있도록 미리 달 파티션을 만들어 둠)
+MAXVALUE_PARTITION = "pmax"
+
+
+class Partition(NamedTuple):
+    name: str
+    upper: Optional[date]  # VALUES LESS THAN 경계 (None이면 MAXVALUE)
+    rows: int  # information_schema 추정 행 수
+
+
+class PartitionStep(NamedTuple):
+    action: str  # partition(처음 분할) / add(다음 달 추가) / archive(보관 테이블로 분리 후 제거) / drop(제거)
+    partition: Optional[str]
+    rows: int
+    sql: List[str]
+
+
+def month_start(value) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(upper: date) -> str:
+    """경계 바로 앞 달의 이름 (p202610은 2026-10-01 이상 2026-11-01 미만)"""
+    month = add_months(upper, -1)
+    return "p%04d%02d" % (month.year, month.month)
+
+
+def archive_table(table: str, partition: str) -> str:
+    return "%s_archive_%s" % (table, partition[1:])
+
+
+def parse_bound(description: str) -> Optional[date]:
+    """information_schema.PARTITIONS.PARTITION_DESCRIPTION ('2026-11-01 00:00:00' 또는 MAXVALUE)"""
+    if description.upper() == "MAXVALUE":
+        return None
+    return date.fromisoformat(description.strip("'")[:10])
+
+
+def month_bounds(first: date, last: date) -> List[date]:
+    """first 다음 달 1일부터 last까지의 달 경계"""
+    bounds = []
+    upper = add_months(first, 1)
+    while upper <= last:
+        bounds.append(upper)
+        upper = add_months(upper, 1)
+    return bounds
+
+
+def partition_definitions(bounds: Iterable[date]) -> str:
+    definitions = [
+        "PARTITION %s VALUES LESS THAN ('%s')" % (partition_name(upper), upper.isoformat()) for upper in bounds
+    ]
+    definitions.append("PARTITION %s VALUES LESS THAN (MAXVALUE)" % MAXVALUE_PARTITION)
+    return ", ".join(definitions)
+
+
+def plan_partitions(table: str, partitions: List[Partition], oldest: Optional[datetime], today: date,
+                    months_ahead: int, retention_months: int, archive: bool) -> List[PartitionStep]:
+    """현재 파티션 목록에서 월별 RANGE COLUMNS(modified_at) 파티션을 유지하는 작업 목록을 만듭니다
+
+    partitions가 비어 있으면 아직 분할하지 않은 테이블로 보고 가장 오래된 이력의 달부터 분할합니다.
+    이번 달 이후 months_ahead개월까지의 파티션을 미리 만들어 두므로 MAXVALUE 파티션은 늘 비어 있어
+    REORGANIZE가 데이터를 옮기지 않습니다. retention_months가 0보다 크면 경계가 이번 달 1일에서
+    retention_months개월 전 이하인 파티션을 보관(EXCHANGE PARTITION) 또는 제거(DROP PARTITION)합니다.
+    둘 다 행 수와 상관없이 메타데이터만 바꾸는 작업입니다.
+    """
+    this_month = month_start(today)
+    last_bound = add_months(this_month, months_ahead + 1)
+    if not partitions:
+        bounds = month_bounds(month_start(oldest or today), last_bound)
+        return [PartitionStep("partition", None, 0, [
+            # modified_at이 빈 이력은 가장 오래된 파티션에 넣음 (파티션 키는 기본 키에 포함되어야 하므로 NOT NULL)
+            "UPDATE %s SET modified_at = '1970-01-01' WHERE modified_at IS NULL" % table,
+            # 기본 키 변경과 분할을 ALTER 하나로 묶어 테이블을 한 번만 다시 씀
+            "ALTER TABLE %s MODIFY modified_at DATETIME NOT NULL, DROP PRIMARY KEY, ADD PRIMARY KEY (id, modified_at) "
+            "PARTITION BY RANGE COLUMNS(modified_at) (%s)" % (table, partition_definitions(bounds)),
+        ])]
+
+    steps = []
+    bounded = sorted((p for p in partitions if p.upper is not None), key=lambda p: p.upper)
+    newest = bounded[-1].upper if bounded else this_month
+    bounds = month_bounds(newest, last_bound)
+    if bounds:
+        if any(p.name == MAXVALUE_PARTITION for p in partitions):
+            sql = "ALTER TABLE %s REORGANIZE PARTITION %s INTO (%s)" % (
+                table, MAXVALUE_PARTITION, partition_definitions(bounds)
+            )
+        else:
+            sql = "ALTER TABLE %s ADD PARTITION (%s)" % (table, ", ".join(
+                "PARTITION %s VALUES LESS THAN ('%s')" % (partition_name(upper), upper.isoformat())
+                for upper in bounds
+            ))
+        steps.append(PartitionStep("add", ", ".join(partition_name(upper) for upper in bounds), 0, [sql]))
+
+    if retention_months > 0:
+        cutoff = add_months(this_month, -retention_months)
+        # 경계가 cutoff(이번 달 1일 이전) 이하인 파티션만 고르므로 이번 달/미래/MAXVALUE 파티션은 항상 남음
+        for partition in bounded:
+            if partition.upper > cutoff:
+                break
+            if archive:
+                target = archive_table(table, partition.name)
+                steps.append(PartitionStep("archive", partition.name, partition.rows, [
+                    "CREATE TABLE IF NOT EXISTS %s LIKE %s" % (target, table),
+                    "ALTER TABLE %s REMOVE PARTITIONING" % target,
+                    "ALTER TABLE %s EXCHANGE PARTITION %s WITH TABLE %s" % (table, partition.name, target),
+                    "ALTER TABLE %s DROP PARTITION %s" % (table, partition.name),
+                ]))
+            else:
+                steps.append(PartitionStep("drop", partition.name, partition.rows, [
+                    "ALTER TABLE %s DROP PARTITION %s" % (table, partition.name),
+                ]))
+    return steps
+
+
+def read_partitions(conn, table: str) -> List[Partition]:
+    """테이블의 현재 파티션 (분할하지 않은 테이블이면 빈 목록)"""
+    rows = conn.execute(text(
+        "SELECT PARTITION_NAME, PARTITION_METHOD, PARTITION_DESCRIPTION, TABLE_ROWS "
+        "FROM information_schema.PARTITIONS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+        "ORDER BY PARTITION_ORDINAL_POSITION"
+    ), {"table": table}).all()
+    partitions = [
+        Partition(name, parse_bound(description), table_rows or 0)
+        for name, _, description, table_rows in rows if name is not None
+    ]
+    if partitions and rows[0][1] != "RANGE COLUMNS":
+        raise RuntimeError("%s 테이블이 RANGE COLUMNS가 아닌 방식(%s)으로 분할되어 있습니다" % (table, rows[0][1]))
+    return partitions
+
+
+def has_rows(conn, table: str, partition: Optional[str] = None) -> bool:
+    source = "%s PARTITION (%s)" % (table, partition) if partition else table
+    return conn.execute(text("SELECT 1 FROM %s LIMIT 1" % source)).first() is not None
+
+
+def archive_partition(conn, table: str, step: PartitionStep):
+    """지난 파티션을 보관 테이블로 분리(EXCHANGE PARTITION)한 뒤 제거합니다 (plan_partitions의 archive 작업)
+
+    DDL은 트랜잭션으로 묶이지 않으므로 단계마다 현재 상태를 확인해, 중간에 실패해도 다음
+    실행에서 이어서 진행합니다 (이미 분리해 비어 있는 파티션을 다시 맞바꾸지 않음).
+    """
+    create, remove_partitioning, exchange, drop = step.sql
+    target = archive_table(table, step.partition)
+    conn.execute(text(create))
+    if read_partitions(conn, target):
+        conn.execute(text(remove_partitioning))
+    if has_rows(conn, table, step.partition):
+        if has_rows(conn, target):
+            raise RuntimeError("보관 테이블 %s에 이미 이력이 있어 %s 파티션을 분리하지 않았습니다" % (target, step.partition))
+        conn.execute(text(exchange))
+    conn.execute(text(drop))
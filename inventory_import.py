@@ -0,0 +1,100 @@
+import codecs
+import csv
+import zipfile
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+# 가져오기 파일에서 읽는 컬럼 (첫 행은 헤더)
+INVENTORY_COLUMNS = ("mac", "ip", "main", "process", "modifier", "notice")
+
+# (파일의 행 번호, 컬럼 값)
+InventoryRow = Tuple[int, Dict[str, Optional[str]]]
+
+T = TypeVar("T")
+
+
+def _cell(value) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _header(values: Sequence) -> List[str]:
+    header = [(_cell(value) or "").lower() for value in values]
+    if "mac" not in header:
+        raise ValueError("헤더에 mac 컬럼이 없습니다 (mac, ip, main, process, modifier, notice)")
+    return header
+
+
+def _row(header: List[str], values: Sequence) -> Dict[str, Optional[str]]:
+    return {
+        column: _cell(value)
+        for column, value in zip(header, values)
+        if column in INVENTORY_COLUMNS
+    }
+
+
+def _csv_rows(fileobj: BinaryIO) -> Iterator[InventoryRow]:
+    # UploadFile.file(SpooledTemporaryFile)는 Python 3.8에서 readable()/seekable()이 없어
+    # io.TextIOWrapper로 감쌀 수 없으므로 줄 단위로 읽으며 디코딩함 (줄바꿈은 그대로 남아 csv가 처리)
+    reader = csv.reader(codecs.iterdecode(fileobj, "utf-8-sig"))
+    header = _header(next(reader, []))
+
+    def rows():
+        for values in reader:
+            if any(value.strip() for value in values):
+                yield reader.line_num, _row(header, values)
+
+    return rows()
+
+
+def _xlsx_rows(fileobj: BinaryIO) -> Iterator[InventoryRow]:
+    try:
+        import openpyxl
+    except ImportError:
+        raise ValueError("XLSX 가져오기에는 openpyxl 패키지가 필요합니다")
+    # read_only 모드는 시트를 한 행씩 읽어 파일 전체를 메모리에 올리지 않음
+    # zipfile도 seekable()을 쓰므로 SpooledTemporaryFile 대신 안쪽 파일(BytesIO 또는 임시 파일)을 넘김
+    fileobj = getattr(fileobj, "_file", fileobj)
+    try:
+        workbook = openpyxl.load_workbook(fileobj, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, KeyError, OSError):
+        raise ValueError("XLSX 파일을 읽을 수 없습니다")
+    sheet_rows = workbook.active.iter_rows(values_only=True)
+    header = _header(next(sheet_rows, ()))
+
+    def rows():
+        try:
+            for number, values in enumerate(sheet_rows, start=2):
+                if any(_cell(value) for value in values):
+                    yield number, _row(header, values)
+        finally:
+            workbook.close()
+
+    return rows()
+
+
+def open_inventory(filename: Optional[str], fileobj: BinaryIO) -> Iterator[InventoryRow]:
+    """업로드된 CSV/XLSX 파일의 헤더를 확인하고 행을 하나씩 읽는 반복자를 반환합니다
+
+    헤더가 없거나 형식을 읽을 수 없으면 ValueError를 발생시킵니다.
+    """
+    if (filename or "").lower().endswith(".xlsx"):
+        return _xlsx_rows(fileobj)
+    try:
+        return _csv_rows(fileobj)
+    except UnicodeDecodeError:
+        raise ValueError("CSV 파일은 UTF-8 인코딩이어야 합니다")
+    except csv.Error as e:
+        raise ValueError(f"CSV 헤더를 읽을 수 없습니다: {e}")
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """iterable을 size개씩 나눠 반환합니다"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
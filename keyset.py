@@ -0,0 +1,23 @@
+import base64
+import json
+from typing import Any, Dict
+
+from fastapi import HTTPException
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """키셋 페이지네이션 위치를 불투명한 커서 문자열로 인코딩합니다"""
+    raw = json.dumps(values, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """커서 문자열을 복원합니다 (형식이 잘못된 경우 400)"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+    if not isinstance(values, dict):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+    return values
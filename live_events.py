@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from typing import Optional, Set
+
+# 큐가 넘쳐 끊긴 구독자에게 넣는 종료 표시
+CLOSED = None
+
+
+def sse_message(event: str, data: bytes) -> bytes:
+    """Server-Sent Events 메시지 한 건 (data는 한 줄 JSON)"""
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+class EventBroadcaster:
+    """SSE 구독자에게 변경 이벤트를 보내는 프로세스 내 브로드캐스터
+
+    구독자마다 크기가 정해진 큐를 두고, 큐가 가득 찰 만큼 따라오지 못하는 구독자는
+    끊습니다 (브라우저 EventSource가 다시 연결해 목록을 새로 읽음). 메시지는 한 번만
+    만들어 모든 큐에 같은 바이트를 넣으므로 구독자 수가 늘어도 DB 부하는 없습니다.
+    publish는 쓰기 핸들러(스레드 풀)에서 호출되므로 이벤트 루프로 넘겨 큐에 넣습니다.
+
+    version은 이 프로세스가 이벤트로 보낸 변경 카운터 값입니다. 다른 워커의 쓰기로
+    카운터가 건너뛰면 그 변경은 이벤트로 받지 못했으므로 reload 이벤트를 보냅니다.
+    """
+
+    def __init__(self, queue_size: int = 256):
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self.version: Optional[int] = None
+        self.dropped = 0
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    @property
+    def active(self) -> bool:
+        """구독자가 있는지 (없으면 이벤트를 만들지 않음)"""
+        return bool(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def publish(self, event: str, data: bytes):
+        """모든 구독자에게 이벤트를 보냅니다 (어느 스레드에서나 호출 가능)"""
+        if self._loop is None or not self._subscribers:
+            return
+        message = sse_message(event, data)
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, message)
+        except RuntimeError:  # 이벤트 루프 종료 중
+            pass
+
+    def advance(self, version: int):
+        """이 프로세스의 쓰기로 올라간 변경 카운터 값을 기록합니다 (건너뛰었으면 reload)"""
+        with self._lock:
+            skipped = self.version is not None and version > self.version + 1
+            if self.version is None or version > self.version:
+                self.version = version
+        if skipped:
+            self.publish("reload", b"{}")
+
+    def observe(self, version: Optional[int]):
+        """주기적으로 읽은 변경 카운터 값이 보낸 값과 다르면 reload 이벤트를 보냅니다"""
+        with self._lock:
+            changed = version is not None and self.version is not None and version > self.version
+            if version is not None and (self.version is None or version > self.version):
+                self.version = version
+        if changed:
+            self.publish("reload", b"{}")
+
+    def _deliver(self, message: bytes):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._drop(queue)
+
+    def _drop(self, queue: asyncio.Queue):
+        """따라오지 못하는 구독자를 끊습니다 (밀린 메시지를 버리고 종료 표시만 남김)"""
+        self._subscribers.discard(queue)
+        self.dropped += 1
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(CLOSED)
@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+
+
+class ResponseCache:
+    """직렬화된 응답 바이트를 담는 LRU + TTL 캐시
+
+    한 항목을 여러 키(예: 번호와 MAC)로 찾을 수 있으며, 어느 키로 제거하든
+    같은 항목의 다른 키도 함께 제거됩니다. 조회 전에 읽어 둔 generation을 put에 넘기면
+    그 사이 제거(쓰기)가 있었을 때 오래된 값을 저장하지 않습니다.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # 대표 키 -> (만료 시각, 응답 바이트, 항목의 모든 키)
+        self._entries: "OrderedDict[Hashable, Tuple[float, bytes, Tuple[Hashable, ...]]]" = OrderedDict()
+        self._aliases: Dict[Hashable, Hashable] = {}
+        self.generation = 0  # evict/clear 때마다 증가
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # 쓰기로 인한 제거
+        self.expirations = 0  # TTL 만료
+        self.capacity_evictions = 0  # 용량 초과로 밀려난 항목
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """캐시된 응답을 반환합니다 (없거나 만료되면 None)"""
+        with self._lock:
+            primary = self._aliases.get(key)
+            entry = self._entries.get(primary) if primary is not None else None
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                self._discard(primary)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(primary)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, keys: Sequence[Hashable], value: bytes, generation: Optional[int] = None):
+        """응답을 keys 모두로 찾을 수 있게 저장합니다 (첫 번째 키가 대표 키)"""
+        if self.maxsize <= 0:
+            return
+        keys = tuple(keys)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            for key in keys:
+                primary = self._aliases.get(key)
+                if primary is not None:
+                    self._discard(primary)
+            self._entries[keys[0]] = (time.monotonic() + self.ttl, value, keys)
+            for key in keys:
+                self._aliases[key] = keys[0]
+            while len(self._entries) > self.maxsize:
+                self._discard(next(iter(self._entries)))
+                self.capacity_evictions += 1
+
+    def evict(self, *keys: Hashable):
+        """keys 중 하나로 찾을 수 있는 항목을 모두 제거합니다"""
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                primary = self._aliases.get(key)
+                if primary is not None:
+                    self._discard(primary)
+                    self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._aliases.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "capacity_evictions": self.capacity_evictions,
+            }
+
+    def _discard(self, primary: Hashable):
+        _, _, keys = self._entries.pop(primary)
+        for key in keys:
+            if self._aliases.get(key) == primary:
+                del self._aliases[key]
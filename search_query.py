@@ -0,0 +1,92 @@
+import re
+from typing import List, NamedTuple
+
+# 검색어 토큰 중 MAC/IP 조각으로 보는 형식 (예: AA:BB:CC, 10.2.)
+MAC_FRAGMENT = re.compile(r'^[0-9A-Fa-f]{2}([:-][0-9A-Fa-f]{2}){1,5}[:-]?$')
+IP_FRAGMENT = re.compile(r'^[0-9]{1,3}(\.[0-9]{0,3}){1,3}$')
+
+# MATCH ... AGAINST 불리언 모드에서 연산자로 해석되는 문자
+FULLTEXT_OPERATORS = re.compile(r'[+\-<>()~*"@]+')
+
+
+# 필드 한정 검색어 (예: mac:AA:BB:CC, process:PKG, modifier:"장민오")
+QUALIFIED_FIELDS = ("mac", "ip", "main", "process", "modifier")
+QUERY_TOKEN = re.compile(
+    r'(?P<field>[A-Za-z]+):(?:"(?P<quoted>[^"]*)"|(?P<value>\S+))'
+    r'|"(?P<phrase>[^"]*)"'
+    r'|(?P<word>\S+)'
+)
+
+
+class QualifiedTerm(NamedTuple):
+    field: str
+    value: str
+    exact: bool  # 따옴표로 감싼 값은 완전 일치, 그 외는 접두어 일치
+
+
+class ParsedQuery(NamedTuple):
+    terms: List[QualifiedTerm]
+    free_text: str  # 필드 지정이 없는 나머지 검색어
+
+
+class SearchTerms(NamedTuple):
+    mac_prefixes: List[str]
+    ip_prefixes: List[str]
+    words: List[str]
+
+
+def parse_query(q: str) -> ParsedQuery:
+    """검색어를 필드 한정 조건과 나머지 자유 검색어로 나눕니다"""
+    terms = []
+    free_words = []
+    for token in QUERY_TOKEN.finditer(q):
+        field = (token.group("field") or "").lower()
+        if field in QUALIFIED_FIELDS:
+            quoted = token.group("quoted")
+            value = quoted if quoted is not None else token.group("value")
+            if value:
+                terms.append(QualifiedTerm(field, value, quoted is not None))
+        elif token.group("phrase") is not None:
+            free_words.append(token.group("phrase"))
+        else:
+            free_words.append(token.group(0))
+    return ParsedQuery(terms, " ".join(word for word in free_words if word))
+
+
+def normalize_mac_fragment(fragment: str) -> str:
+    """MAC 조각을 저장 형식(대문자, ':' 구분)으로 맞춥니다"""
+    return fragment.upper().replace("-", ":")
+
+
+def split_terms(q: str) -> SearchTerms:
+    """검색어를 MAC 조각, IP 조각, 일반 단어로 나눕니다"""
+    terms = SearchTerms([], [], [])
+    for token in q.split():
+        if MAC_FRAGMENT.match(token):
+            terms.mac_prefixes.append(normalize_mac_fragment(token))
+        elif IP_FRAGMENT.match(token):
+            terms.ip_prefixes.append(token)
+        else:
+            word = FULLTEXT_OPERATORS.sub(" ", token).strip()
+            terms.words.extend(word.split())
+    return terms
+
+
+def is_complete_value(field: str, value: str) -> bool:
+    """MAC/IP 값이 완전한 주소인지 (완전하면 접두어 대신 일치 조건 사용)"""
+    if field == "mac":
+        return len(value) == 17 and MAC_FRAGMENT.match(value) is not None
+    if field == "ip":
+        return re.match(r'^(?:[0-9]{1,3}\.){3}[0-9]{1,3}$', value) is not None
+    return False
+
+
+def like_prefix(value: str) -> str:
+    """인덱스 범위 검색이 가능한 접두어 LIKE 패턴 (escape 문자는 '/')"""
+    escaped = value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return escaped + "%"
+
+
+def boolean_query(words: List[str]) -> str:
+    """모든 단어를 포함(접두어 일치)하는 불리언 모드 검색식"""
+    return " ".join(f"+{word}*" for word in words)
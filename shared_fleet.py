@@ -0,0 +1,574 @@
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from fleet_snapshot import SnapshotRow
+
+T = TypeVar("T")
+
+# 파일 구조: 헤더 | 행 슬롯(capacity개) | no 해시 색인 | mac_int 해시 색인
+#            | no 순 정렬 색인 | (updated_at, no) 순 정렬 색인 | 문자열 영역
+MAGIC = b"EDGEFLT2"
+# magic, seq, version, capacity, hash_size, slots_used, rows, arena_size, arena_used, ready, writes
+HEADER = struct.Struct("<8sQqIIIIQQIQ")
+HEADER_SIZE = 128
+# no, mac_int, updated_at(µs), stamp(마지막 put/remove의 writes 값), ip_bin, has_ip, deleted,
+# 문자열 참조 7개 (offset, length), 응답 JSON 안의 last_seen 값 위치
+ROW = struct.Struct("<qqqq16sBB6x14II")
+SLOT = struct.Struct("<i")
+STRING_FIELDS = ("json", "search_text", "mac", "ip", "main", "process", "modifier")
+ORDERS = ("no", "updated_at")
+
+EMPTY = 0
+DELETED = -1  # 해시 색인의 삭제 표시
+STALE_VERSION = -1  # 게시한 내용이 변경 카운터와 맞는지 알 수 없음 (다음 확인 때 다시 읽음)
+EPOCH = datetime(1970, 1, 1)
+OPTIMISTIC_READS = 3  # 이 횟수만큼 쓰기와 겹치면 공유 잠금으로 읽음
+ITER_CHUNK = 1000  # 정렬 순서로 전체를 훑을 때 한 번에 읽는 행 수
+
+# 응답 JSON의 last_seen 값은 고정 폭으로 저장해 heartbeat 때 그 자리만 고쳐 씀 (짧은 값은 뒤를 공백으로 채움)
+LAST_SEEN_KEY = b'"last_seen":'
+LAST_SEEN_WIDTH = 34  # '"2026-10-17T12:34:56.123456+09:00"'
+NO_LAST_SEEN = 0xFFFFFFFF
+
+
+def _micros(value: datetime) -> int:
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def _datetime(micros: int) -> datetime:
+    return EPOCH + timedelta(microseconds=micros)
+
+
+def _last_seen_json(value: Optional[datetime]) -> bytes:
+    return (b"null" if value is None else b'"%s"' % value.isoformat().encode()).ljust(LAST_SEEN_WIDTH)
+
+
+def _pad_last_seen(json: bytes) -> Tuple[bytes, int]:
+    """응답 JSON의 last_seen 값을 고정 폭으로 바꾸고 그 위치를 반환합니다 (없으면 NO_LAST_SEEN)"""
+    key = json.rfind(LAST_SEEN_KEY)
+    if key < 0:
+        return json, NO_LAST_SEEN
+    start = key + len(LAST_SEEN_KEY)
+    end = start + 4 if json.startswith(b"null", start) else json.index(b'"', start + 1) + 1
+    while json[end:end + 1] == b" ":
+        end += 1
+    value = json[start:end].rstrip()
+    if len(value) > LAST_SEEN_WIDTH:
+        return json, NO_LAST_SEEN
+    return json[:start] + value.ljust(LAST_SEEN_WIDTH) + json[end:], start
+
+
+class SharedFleetFull(Exception):
+    """슬롯이나 문자열 영역이 부족해 더 쓸 수 없음"""
+
+
+class SharedFleetTable:
+    """여러 워커 프로세스가 함께 쓰는 메모리 매핑 장비 테이블
+
+    고정 크기 행 슬롯, no/mac_int 해시 색인, 정렬 색인, 문자열 영역을 한 파일(/dev/shm 권장)에 두고
+    모든 워커가 같은 페이지를 매핑해 읽으므로 워커 수가 늘어도 메모리 사용량이 같습니다.
+    쓰기는 파일 잠금(flock)으로 한 번에 한 프로세스만 하고, 헤더의 seq를 쓰기 전후로
+    올려(seqlock) 읽는 쪽은 잠금 없이 읽은 뒤 seq가 그대로인지만 확인합니다.
+    정렬 색인(슬롯 번호 배열)은 쓰기 때 함께 고치므로 목록 요청은 필요한 행만 읽습니다.
+    문자열 영역은 추가만 하므로 가득 차면 살아 있는 행만 다시 써서 압축합니다.
+    파일을 연 프로세스는 첫 바이트에 공유 레코드 잠금(lockf)을 잡고 있으므로, 열 때 아무도
+    잡고 있지 않으면 이전 실행에서 남은 파일로 보고 비운 뒤 다시 만듭니다.
+    """
+
+    def __init__(self, path: str, capacity: int = 100000, arena_size: int = 64 * 1024 * 1024):
+        import fcntl  # Linux/Unix 전용
+
+        self._fcntl = fcntl
+        self.path = path
+        self._thread_lock = threading.Lock()  # flock은 같은 프로세스의 스레드끼리는 막지 못함
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        hash_size = 1
+        while hash_size < capacity * 2:
+            hash_size *= 2
+        size = HEADER_SIZE + capacity * ROW.size + 2 * (hash_size + capacity) * SLOT.size + arena_size
+        with self._write_lock():
+            try:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, 0)
+                leftover = True  # 파일을 쓰는 다른 프로세스가 없음
+            except OSError:
+                leftover = False
+            if leftover or os.fstat(self._fd).st_size < HEADER_SIZE or os.pread(self._fd, len(MAGIC), 0) != MAGIC:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                self._map = mmap.mmap(self._fd, size)
+                HEADER.pack_into(self._map, 0, MAGIC, 0, 0, capacity, hash_size, 0, 0, arena_size, 0, 0, 0)
+            else:
+                self._map = mmap.mmap(self._fd, os.fstat(self._fd).st_size)
+            fcntl.lockf(self._fd, fcntl.LOCK_SH, 1, 0)  # 닫을 때까지 유지
+        # 다른 프로세스가 쓰고 있는 파일이면 파일에 기록된 크기를 따름
+        _, _, _, self.capacity, self.hash_size, _, _, self.arena_size, _, _, _ = HEADER.unpack_from(self._map, 0)
+        self._rows_at = HEADER_SIZE
+        self._no_index_at = self._rows_at + self.capacity * ROW.size
+        self._mac_index_at = self._no_index_at + self.hash_size * SLOT.size
+        self._order_at = {"no": self._mac_index_at + self.hash_size * SLOT.size}
+        self._order_at["updated_at"] = self._order_at["no"] + self.capacity * SLOT.size
+        self._arena_at = self._order_at["updated_at"] + self.capacity * SLOT.size
+        self._responses: Dict[Hashable, Any] = {}
+        self._responses_seq = -1
+
+    # 헤더
+
+    def _header(self) -> list:
+        return list(HEADER.unpack_from(self._map, 0))
+
+    @property
+    def seq(self) -> int:
+        return struct.unpack_from("<Q", self._map, 8)[0]
+
+    @property
+    def version(self) -> int:
+        return struct.unpack_from("<q", self._map, 16)[0]
+
+    @property
+    def loaded(self) -> bool:
+        """전체 행이 한 번 이상 게시되었는지"""
+        return self._header()[9] == 1
+
+    def __len__(self):
+        return self._header()[6]
+
+    # 쓰기
+
+    @contextmanager
+    def _write_lock(self):
+        with self._thread_lock:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+
+    def _begin(self):
+        struct.pack_into("<Q", self._map, 8, self.seq + 1)
+
+    def _end(self):
+        struct.pack_into("<Q", self._map, 8, self.seq + 1)
+
+    def _write(self, mutate: Callable[[], None]):
+        with self._write_lock():
+            self._begin()
+            try:
+                mutate()
+            finally:
+                self._end()
+
+    def begin_load(self) -> int:
+        """DB에서 변경 카운터와 행을 읽기 직전에 호출합니다 (반환값을 publish의 since로 넘김)"""
+        return self._header()[10]
+
+    def publish(self, rows: Iterable[SnapshotRow], version: int, since: Optional[int] = None) -> bool:
+        """전체 행을 다시 씁니다 (이미 같은 version이 게시되어 있으면 건너뜀)
+
+        since(begin_load 값) 이후 어느 워커든 put/remove한 행은 읽은 행 위에 다시 반영하므로,
+        DB를 읽은 뒤 커밋된 쓰기가 교체로 사라지지 않습니다. 그 쓰기가 읽은 행보다 오래된 값일
+        수도 있으므로 이때는 version을 STALE_VERSION으로 게시해 다음 확인 때 한 번 더 읽게 합니다.
+        """
+        rows = {row.no: (row, 0) for row in rows}
+        with self._write_lock():
+            if self.loaded and self.version == version:
+                return False
+            if since is not None and self._header()[10] != since:
+                for slot in range(self._header()[5]):
+                    no, stamp, deleted = self._slot_state(slot)
+                    if stamp <= since:
+                        continue
+                    if deleted:
+                        rows.pop(no, None)
+                    else:
+                        rows[no] = (self._row(slot), stamp)
+                version = STALE_VERSION
+            self._begin()
+            try:
+                self._reset(list(rows.values()), version)
+            finally:
+                self._end()
+        return True
+
+    def put(self, row: SnapshotRow):
+        """행을 추가하거나 교체합니다 (공간이 부족하면 압축 후 다시 시도)"""
+        def mutate():
+            stamp = self._next_write()
+            try:
+                self._put(row, stamp)
+            except SharedFleetFull:
+                self._compact()
+                self._put(row, stamp)
+        self._write(mutate)
+
+    def remove(self, no: int):
+        self._write(lambda: self._remove(no, self._next_write()))
+
+    def set_last_seen(self, items: Iterable[Tuple[int, Optional[datetime]]]):
+        """(no, last_seen)을 응답 JSON의 last_seen 자리에 그대로 덮어씁니다
+
+        heartbeat는 last_seen만 바꾸므로 행을 다시 쓰지 않아 문자열 영역을 쓰지 않고 압축도 일어나지 않습니다.
+        워커마다 따로 flush하므로 이미 더 최근 값(다른 워커가 먼저 반영)이 있으면 그대로 둡니다.
+        같은 형식의 ISO 시각 문자열은 바이트 순서가 시간 순서와 같아 그대로 비교합니다.
+        """
+        items = [(no, _last_seen_json(value)) for no, value in items if value is not None]
+
+        def mutate():
+            for no, value in items:
+                slot = self._find(self._no_index_at, no)
+                if slot is None or len(value) > LAST_SEEN_WIDTH:
+                    continue
+                record = ROW.unpack_from(self._map, self._rows_at + slot * ROW.size)
+                json_offset, last_seen_at = record[7], record[-1]
+                if last_seen_at != NO_LAST_SEEN:
+                    at = self._arena_at + json_offset + last_seen_at
+                    current = bytes(self._map[at:at + LAST_SEEN_WIDTH])
+                    if current.startswith(b"null") or current.rstrip() < value.rstrip():
+                        self._map[at:at + LAST_SEEN_WIDTH] = value
+        self._write(mutate)
+
+    def advance(self, version: int):
+        """쓰기로 올라간 변경 카운터를 기록합니다 (바로 다음 값일 때만, 아니면 다시 게시될 때까지 유지)"""
+        def mutate():
+            if self.version != STALE_VERSION and version == self.version + 1:
+                struct.pack_into("<q", self._map, 16, version)
+        self._write(mutate)
+
+    def invalidate(self):
+        """게시 상태를 해제합니다 (다시 게시될 때까지 읽는 쪽은 공유 테이블을 쓰지 않음)"""
+        def mutate():
+            header = self._header()
+            header[9] = 0
+            HEADER.pack_into(self._map, 0, *header)
+        self._write(mutate)
+
+    def _next_write(self) -> int:
+        header = self._header()
+        header[10] += 1
+        HEADER.pack_into(self._map, 0, *header)
+        return header[10]
+
+    def _reset(self, rows: List[Tuple[SnapshotRow, int]], version: int):
+        """(행, stamp) 목록으로 전체를 다시 씁니다 (정렬 색인은 마지막에 한 번 정렬해 채움)"""
+        header = self._header()
+        if len(rows) > self.capacity:
+            header[9] = 0
+            HEADER.pack_into(self._map, 0, *header)
+            raise SharedFleetFull(f"공유 테이블 슬롯이 부족합니다 ({len(rows)} > {self.capacity})")
+        start, end = self._no_index_at, self._arena_at
+        self._map[start:end] = bytes(end - start)
+        header[2] = version
+        header[5] = header[6] = 0
+        header[8] = 0
+        header[9] = 0
+        HEADER.pack_into(self._map, 0, *header)
+        for row, stamp in rows:
+            self._put(row, stamp, ordered=False)
+        for order, key in (("no", lambda slot: rows[slot][0].no),
+                           ("updated_at", lambda slot: (rows[slot][0].values["updated_at"], rows[slot][0].no))):
+            slots = array("i", sorted(range(len(rows)), key=key)).tobytes()
+            self._map[self._order_at[order]:self._order_at[order] + len(slots)] = slots
+        header = self._header()
+        header[9] = 1
+        HEADER.pack_into(self._map, 0, *header)
+
+    def _compact(self):
+        rows = [(self._row(slot), self._slot_state(slot)[1]) for slot in range(self._header()[5])]
+        self._reset([(row, stamp) for row, stamp in rows if row is not None], self.version)
+
+    def _store_string(self, header: list, data: bytes) -> Tuple[int, int]:
+        offset = header[8]
+        if offset + len(data) > self.arena_size:
+            raise SharedFleetFull("공유 테이블 문자열 영역이 부족합니다")
+        at = self._arena_at + offset
+        self._map[at:at + len(data)] = data
+        header[8] = offset + len(data)
+        return offset, len(data)
+
+    def _put(self, row: SnapshotRow, stamp: int, ordered: bool = True):
+        header = self._header()
+        values = row.values
+        json, last_seen_at = _pad_last_seen(row.json)
+        strings = [json] + [(values[field] or "").encode() for field in STRING_FIELDS[1:]]
+        old_slot = self._find(self._no_index_at, row.no)
+        if old_slot is None and header[5] >= self.capacity:
+            raise SharedFleetFull("공유 테이블 슬롯이 부족합니다")
+        refs = []
+        for data in strings:
+            refs.extend(self._store_string(header, data))
+        mac_int = values["mac_int"] if values["mac_int"] is not None else -1
+        ip_bin = values["ip_bin"]
+        updated_at = _micros(values["updated_at"])
+        record = (
+            row.no, mac_int, updated_at, stamp,
+            bytes(ip_bin) if ip_bin is not None else bytes(16), ip_bin is not None, False, *refs, last_seen_at
+        )
+
+        moved = False
+        if old_slot is not None:
+            old_mac, old_updated_at = struct.unpack_from("<qq", self._map, self._rows_at + old_slot * ROW.size + 8)
+            if old_mac != mac_int:
+                self._unindex(self._mac_index_at, old_mac)
+            slot = old_slot
+            if ordered and old_updated_at != updated_at:
+                self._order_remove("updated_at", header[6], slot)
+                moved = True
+        else:
+            slot = header[5]
+            header[5] += 1
+            self._index(self._no_index_at, row.no, slot)
+        ROW.pack_into(self._map, self._rows_at + slot * ROW.size, *record)
+        if mac_int != -1:
+            self._index(self._mac_index_at, mac_int, slot)
+        if old_slot is None:
+            if ordered:
+                self._order_insert("no", header[6], slot)
+                self._order_insert("updated_at", header[6], slot)
+            header[6] += 1
+        elif moved:
+            self._order_insert("updated_at", header[6] - 1, slot)
+        HEADER.pack_into(self._map, 0, *header)
+
+    def _remove(self, no: int, stamp: int):
+        slot = self._find(self._no_index_at, no)
+        if slot is None:
+            return
+        header = self._header()
+        for order in ORDERS:
+            self._order_remove(order, header[6], slot)
+        at = self._rows_at + slot * ROW.size
+        mac_int = struct.unpack_from("<q", self._map, at + 8)[0]
+        # no는 남겨 두어 publish가 읽는 동안 지워진 행을 알 수 있게 함
+        struct.pack_into("<q", self._map, at + 24, stamp)
+        struct.pack_into("<B", self._map, at + 49, True)
+        self._unindex(self._no_index_at, no)
+        if mac_int != -1:
+            self._unindex(self._mac_index_at, mac_int)
+        header[6] -= 1
+        HEADER.pack_into(self._map, 0, *header)
+
+    def _slot_state(self, slot: int) -> Tuple[int, int, bool]:
+        """(no, stamp, 삭제 여부)"""
+        at = self._rows_at + slot * ROW.size
+        no, stamp = struct.unpack_from("<q", self._map, at)[0], struct.unpack_from("<q", self._map, at + 24)[0]
+        return no, stamp, bool(self._map[at + 49])
+
+    # 정렬 색인 (정렬 순서대로 놓인 슬롯 번호 배열, 길이는 살아 있는 행 수)
+
+    def _order_key(self, order: str, slot: int) -> tuple:
+        at = self._rows_at + slot * ROW.size
+        no = struct.unpack_from("<q", self._map, at)[0]
+        if order == "no":
+            return (no,)
+        return struct.unpack_from("<q", self._map, at + 16)[0], no
+
+    def _order_slot(self, order: str, position: int) -> int:
+        return SLOT.unpack_from(self._map, self._order_at[order] + position * SLOT.size)[0]
+
+    def _order_bisect(self, order: str, count: int, key: tuple) -> int:
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if self._order_key(order, self._order_slot(order, middle)) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _order_insert(self, order: str, count: int, slot: int):
+        position = self._order_bisect(order, count, self._order_key(order, slot))
+        at = self._order_at[order] + position * SLOT.size
+        self._map.move(at + SLOT.size, at, (count - position) * SLOT.size)
+        SLOT.pack_into(self._map, at, slot)
+
+    def _order_remove(self, order: str, count: int, slot: int):
+        position = self._order_bisect(order, count, self._order_key(order, slot))
+        if position >= count or self._order_slot(order, position) != slot:
+            return
+        at = self._order_at[order] + position * SLOT.size
+        self._map.move(at, at + SLOT.size, (count - position - 1) * SLOT.size)
+
+    def _order_slots(self, order: str, index: slice) -> List[int]:
+        start, stop, step = index.indices(self._header()[6])
+        if step != 1:
+            return [self._order_slot(order, position) for position in range(start, stop, step)]
+        if stop <= start:
+            return []
+        return list(struct.unpack_from("<%di" % (stop - start), self._map, self._order_at[order] + start * SLOT.size))
+
+    # 해시 색인 (선형 탐사, 값은 슬롯 번호 + 1)
+
+    def _probe(self, key: int) -> Iterator[int]:
+        mask = self.hash_size - 1
+        position = (key * 0x9E3779B97F4A7C15 >> 16) & mask
+        for _ in range(self.hash_size):
+            yield position
+            position = (position + 1) & mask
+
+    def _slot_key(self, index_at: int, slot: int) -> int:
+        offset = 8 if index_at == self._mac_index_at else 0
+        return struct.unpack_from("<q", self._map, self._rows_at + slot * ROW.size + offset)[0]
+
+    def _find_position(self, index_at: int, key: int) -> Optional[int]:
+        for position in self._probe(key):
+            entry = SLOT.unpack_from(self._map, index_at + position * SLOT.size)[0]
+            if entry == EMPTY:
+                return None
+            if entry != DELETED and self._slot_key(index_at, entry - 1) == key:
+                return position
+        return None
+
+    def _find(self, index_at: int, key: int) -> Optional[int]:
+        position = self._find_position(index_at, key)
+        if position is None:
+            return None
+        return SLOT.unpack_from(self._map, index_at + position * SLOT.size)[0] - 1
+
+    def _index(self, index_at: int, key: int, slot: int):
+        position = self._find_position(index_at, key)
+        if position is None:
+            for position in self._probe(key):
+                entry = SLOT.unpack_from(self._map, index_at + position * SLOT.size)[0]
+                if entry in (EMPTY, DELETED):
+                    break
+        SLOT.pack_into(self._map, index_at + position * SLOT.size, slot + 1)
+
+    def _unindex(self, index_at: int, key: int):
+        position = self._find_position(index_at, key)
+        if position is not None:
+            SLOT.pack_into(self._map, index_at + position * SLOT.size, DELETED)
+
+    # 읽기
+
+    def _row(self, slot: int) -> Optional[SnapshotRow]:
+        record = ROW.unpack_from(self._map, self._rows_at + slot * ROW.size)
+        no, mac_int, updated_at, _, ip_bin, has_ip, deleted = record[:7]
+        if deleted:
+            return None
+        refs = record[7:-1]
+        strings = []
+        for i in range(0, len(refs), 2):
+            at = self._arena_at + refs[i]
+            strings.append(self._map[at:at + refs[i + 1]])
+        values = {field: data.decode() or None for field, data in zip(STRING_FIELDS[1:], strings[1:])}
+        values["search_text"] = values["search_text"] or ""
+        values.update(
+            mac_int=mac_int if mac_int != -1 else None,
+            ip_bin=ip_bin if has_ip else None,
+            updated_at=_datetime(updated_at),
+        )
+        return SnapshotRow(no, values, strings[0])
+
+    def _scan(self) -> Iterator[SnapshotRow]:
+        for slot in range(self._header()[5]):
+            row = self._row(slot)
+            if row is not None:
+                yield row
+
+    def _read(self, read: Callable[[], T]) -> T:
+        """seqlock으로 일관된 값을 읽습니다 (쓰기와 계속 겹치면 공유 잠금을 잡고 읽음)"""
+        for _ in range(OPTIMISTIC_READS):
+            before = self.seq
+            if before % 2 == 0:
+                try:
+                    result = read()
+                except (struct.error, UnicodeDecodeError, ValueError, IndexError, OverflowError):
+                    # 쓰는 도중의 값을 읽은 경우 - 그 사이 쓰기가 없었다면 실제 오류
+                    if self.seq == before:
+                        raise
+                    continue
+                if self.seq == before:
+                    return result
+            time.sleep(0)
+        with self._thread_lock:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_SH)
+            try:
+                return read()
+            finally:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+
+    def get(self, no: int) -> Optional[SnapshotRow]:
+        def read():
+            slot = self._find(self._no_index_at, no)
+            return self._row(slot) if slot is not None else None
+        return self._read(read)
+
+    def get_by_mac(self, mac_int: int) -> Optional[SnapshotRow]:
+        def read():
+            slot = self._find(self._mac_index_at, mac_int)
+            return self._row(slot) if slot is not None else None
+        return self._read(read)
+
+    def rows(self) -> List[SnapshotRow]:
+        return self._read(lambda: list(self._scan()))
+
+    # FleetSnapshot과 같은 읽기 인터페이스 (정렬 색인 위의 시퀀스라 복사/정렬 없이 필요한 행만 읽음)
+
+    def ordered(self, order: str) -> Tuple["OrderedView", "OrderedView"]:
+        """(order 값, no) 순의 행과 정렬 키 시퀀스 (bisect, 슬라이스, 순회 가능)"""
+        if order == "no":
+            key = lambda slot: (self._order_key(order, slot)[0],)
+        else:
+            key = lambda slot: (lambda micros, no: (_datetime(micros), no))(*self._order_key(order, slot))
+        return OrderedView(self, order, self._row), OrderedView(self, order, key)
+
+    def response(self, key: Hashable, build: Callable[[], T]) -> T:
+        """key에 해당하는 직렬화된 응답 (seq가 바뀔 때까지 이 워커에서 재사용)"""
+        seq = self.seq
+        if seq != self._responses_seq:
+            self._responses = {}
+            self._responses_seq = seq
+        body = self._responses.get(key)
+        if body is None:
+            body = build()
+            if self.seq == seq and len(self._responses) < 256:
+                self._responses[key] = body
+        return body
+
+    def close(self):
+        self._map.close()
+        os.close(self._fd)  # lockf 잠금도 함께 풀림
+
+
+class OrderedView:
+    """공유 테이블의 정렬 색인을 따라 읽는 시퀀스
+
+    원소 하나 또는 슬라이스 하나를 seqlock으로 일관되게 읽습니다. 순회는 ITER_CHUNK 행씩
+    읽으므로 검색처럼 앞에서부터 훑다가 멈추는 경우 필요한 만큼만 읽습니다.
+    """
+
+    def __init__(self, table: SharedFleetTable, order: str, item: Callable[[int], Any]):
+        self._table = table
+        self._order = order
+        self._item = item
+
+    def __len__(self):
+        return self._table._read(lambda: self._table._header()[6])
+
+    def __getitem__(self, index):
+        table = self._table
+        if isinstance(index, slice):
+            return table._read(lambda: [self._item(slot) for slot in table._order_slots(self._order, index)])
+
+        def read():
+            count = table._header()[6]
+            position = index + count if index < 0 else index
+            if not 0 <= position < count:
+                raise IndexError("정렬 색인 범위를 벗어났습니다")
+            return self._item(table._order_slot(self._order, position))
+        return table._read(read)
+
+    def __iter__(self) -> Iterator[Any]:
+        start = 0
+        while True:
+            chunk = self[start:start + ITER_CHUNK]
+            if not chunk:
+                return
+            yield from chunk
+            start += len(chunk)
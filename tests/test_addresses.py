@@ -0,0 +1,88 @@
+import pytest
+
+from addresses import bin_to_ip, canonical_mac, cidr_range, int_to_mac, ip_to_bin, mac_prefix_range, mac_to_int
+
+
+@pytest.mark.parametrize("mac, value", [
+    ("AA:BB:CC:DD:EE:FF", 0xAABBCCDDEEFF),
+    ("aa-bb-cc-dd-ee-ff", 0xAABBCCDDEEFF),
+    ("00:00:00:00:00:00", 0),
+    ("FF:FF:FF:FF:FF:FF", (1 << 48) - 1),
+])
+def test_mac_int_round_trip(mac, value):
+    assert mac_to_int(mac) == value
+    assert int_to_mac(value) == canonical_mac(mac)
+
+
+@pytest.mark.parametrize("mac", ["", "AA:BB:CC:DD:EE", "AA:BB:CC:DD:EE:FF:00", "AABBCCDDEEFF", "GG:BB:CC:DD:EE:FF",
+                                 "AA.BB.CC.DD.EE.FF", "AA:BB:CC:DD:EE:F"])
+def test_invalid_mac_raises(mac):
+    with pytest.raises(ValueError):
+        mac_to_int(mac)
+
+
+@pytest.mark.parametrize("prefix, start, end", [
+    ("AA:BB:CC", 0xAABBCC000000, 0xAABBCCFFFFFF),
+    ("aa-bb-cc", 0xAABBCC000000, 0xAABBCCFFFFFF),
+    ("AABBCC", 0xAABBCC000000, 0xAABBCCFFFFFF),
+    # 16진수 한 자리 단위
+    ("AA:B", 0xAAB000000000, 0xAABFFFFFFFFF),
+    ("0", 0, 0x0FFFFFFFFFFF),
+    ("F", 0xF00000000000, (1 << 48) - 1),
+    # 완전한 주소는 그 주소 하나
+    ("AA:BB:CC:DD:EE:FF", 0xAABBCCDDEEFF, 0xAABBCCDDEEFF),
+    ("AA:BB:CC:", 0xAABBCC000000, 0xAABBCCFFFFFF),
+])
+def test_mac_prefix_range(prefix, start, end):
+    assert mac_prefix_range(prefix) == (start, end)
+
+
+@pytest.mark.parametrize("prefix", ["", ":", "AA:BB:CC:DD:EE:FF:0", "AA:XY", "10.0.0.1/8"])
+def test_invalid_mac_prefix_raises(prefix):
+    with pytest.raises(ValueError):
+        mac_prefix_range(prefix)
+
+
+def v4(*octets) -> bytes:
+    return bytes(10) + b"\xff\xff" + bytes(octets)
+
+
+@pytest.mark.parametrize("ip, value", [
+    ("10.0.0.1", v4(10, 0, 0, 1)),
+    ("0.0.0.0", v4(0, 0, 0, 0)),
+    ("255.255.255.255", v4(255, 255, 255, 255)),
+    ("2001:db8::1", bytes.fromhex("20010db8000000000000000000000001")),
+    ("::1", bytes(15) + b"\x01"),
+])
+def test_ip_bin_round_trip(ip, value):
+    assert ip_to_bin(ip) == value and len(value) == 16
+    assert bin_to_ip(value) == ip
+
+
+@pytest.mark.parametrize("ip", [None, "", "10.0.0", "10.0.0.256", "10.0.0.1/24", "localhost", " 10.0.0.1"])
+def test_invalid_ip_is_none(ip):
+    assert ip_to_bin(ip) is None
+
+
+def test_ip_bin_order_matches_address_order():
+    ips = ["2001:db8::1", "10.0.0.10", "9.255.255.255", "10.0.0.9", "::1", "192.168.0.1"]
+    assert sorted(ips, key=ip_to_bin) == ["::1", "9.255.255.255", "10.0.0.9", "10.0.0.10", "192.168.0.1", "2001:db8::1"]
+
+
+@pytest.mark.parametrize("cidr, start, end", [
+    ("10.20.0.0/16", v4(10, 20, 0, 0), v4(10, 20, 255, 255)),
+    # 호스트 비트가 있어도 그 서브넷으로 봄
+    ("10.20.3.4/16", v4(10, 20, 0, 0), v4(10, 20, 255, 255)),
+    (" 192.168.1.7/32 ", v4(192, 168, 1, 7), v4(192, 168, 1, 7)),
+    ("192.168.1.7", v4(192, 168, 1, 7), v4(192, 168, 1, 7)),
+    ("0.0.0.0/0", v4(0, 0, 0, 0), v4(255, 255, 255, 255)),
+    ("2001:db8::/32", bytes.fromhex("20010db8" + "00" * 12), bytes.fromhex("20010db8" + "ff" * 12)),
+])
+def test_cidr_range(cidr, start, end):
+    assert cidr_range(cidr) == (start, end)
+
+
+@pytest.mark.parametrize("cidr", ["", "10.20.0.0/33", "10.20.0/16", "net"])
+def test_invalid_cidr_raises(cidr):
+    with pytest.raises(ValueError):
+        cidr_range(cidr)
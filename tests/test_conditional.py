@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+from fastapi import Request
+
+from conditional import body_etag, http_date, not_modified, opaque_tag, state_etag, validator_headers
+
+STRONG = state_etag(7, "list")
+WEAK = state_etag(7, "list", weak=True)
+MODIFIED = datetime(2026, 10, 17, 9, 0, 5, 250000)
+
+
+def request(**headers) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+def test_etags():
+    assert body_etag(b"[]") == body_etag(b"[]") != body_etag(b"[1]")
+    assert STRONG.startswith('"') and WEAK == "W/" + STRONG
+    assert state_etag(8, "list") != STRONG
+
+
+@pytest.mark.parametrize("tag, opaque", [
+    ('"abc"', '"abc"'),
+    ('W/"abc"', '"abc"'),
+    (' W/"abc" ', '"abc"'),
+    # 접두어만 떼고 태그 안의 W나 /는 그대로 둠
+    ('W/"W/x"', '"W/x"'),
+    ('"/W"', '"/W"'),
+    ('W/W/"a"', 'W/"a"'),
+])
+def test_opaque_tag_removes_only_the_weak_prefix(tag, opaque):
+    assert opaque_tag(tag) == opaque
+
+
+@pytest.mark.parametrize("if_none_match, etag, expected", [
+    (STRONG, STRONG, True),
+    # 약한 비교: 어느 쪽이 W/여도 같은 태그로 봄
+    ("W/" + STRONG, STRONG, True),
+    (STRONG, WEAK, True),
+    (WEAK, WEAK, True),
+    ('"other", ' + WEAK, STRONG, True),
+    ('"other",W/"more"', STRONG, False),
+    ("*", STRONG, True),
+    ('"W/%s' % STRONG[1:], STRONG, False),
+    ("", STRONG, False),
+])
+def test_if_none_match(if_none_match, etag, expected):
+    assert not_modified(request(if_none_match=if_none_match), etag) is expected
+
+
+def test_if_modified_since():
+    etag = body_etag(b"[]")
+    assert not_modified(request(if_modified_since=http_date(MODIFIED)), etag, MODIFIED)
+    assert not_modified(request(if_modified_since="Sat, 17 Oct 2026 09:00:06 GMT"), etag, MODIFIED)
+    assert not not_modified(request(if_modified_since="Sat, 17 Oct 2026 09:00:04 GMT"), etag, MODIFIED)
+    assert not not_modified(request(if_modified_since="yesterday"), etag, MODIFIED)
+    assert not not_modified(request(if_modified_since=http_date(MODIFIED)), etag)
+    # If-None-Match가 있으면 If-Modified-Since는 보지 않음
+    assert not not_modified(request(if_none_match='"other"', if_modified_since=http_date(MODIFIED)), etag, MODIFIED)
+    assert not not_modified(request(), etag, MODIFIED)
+
+
+def test_validator_headers():
+    assert validator_headers(STRONG) == {"ETag": STRONG, "Cache-Control": "no-cache"}
+    assert validator_headers(STRONG, MODIFIED)["Last-Modified"] == "Sat, 17 Oct 2026 09:00:05 GMT"
@@ -0,0 +1,111 @@
+from fleet_snapshot import FleetSnapshot, SnapshotRow, page_after
+
+
+def row(no: int, main: str = "A15A") -> SnapshotRow:
+    return SnapshotRow(no, {"no": no, "main": main}, b'{"no":%d,"main":"%s"}' % (no, main.encode()))
+
+
+def test_ordered_pages_by_column_then_no():
+    snapshot = FleetSnapshot()
+    snapshot.load([row(3, "B"), row(1, "B"), row(2, "A"), row(4, "C")], 1)
+    rows, keys = snapshot.ordered("main")
+    assert [r.no for r in rows] == [2, 1, 3, 4]
+    assert keys[1] == ("B", 1)
+    # 정렬 결과는 바뀔 때까지 재사용
+    assert snapshot.ordered("main")[0] is rows
+
+    page, more = page_after(rows, keys, None, 2)
+    assert [r.no for r in page] == [2, 1] and more
+    page, more = page_after(rows, keys, keys[1], 2)
+    assert [r.no for r in page] == [3, 4] and not more
+    # 커서의 행이 그 사이 지워졌어도 다음 위치부터
+    page, _ = page_after(rows, keys, ("B", 2), 2)
+    assert [r.no for r in page] == [3, 4]
+    assert page_after(rows, keys, keys[-1], 2) == ([], False)
+
+    rows, keys = snapshot.ordered("no")
+    assert keys == [(1,), (2,), (3,), (4,)]
+
+
+def test_put_and_remove_invalidate_orders_and_responses():
+    snapshot = FleetSnapshot()
+    snapshot.load([row(1), row(2)], 1)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return b"[...]"
+
+    assert snapshot.response(("list", 1), build) == b"[...]"
+    snapshot.response(("list", 1), build)
+    assert len(builds) == 1
+    rows = snapshot.ordered("no")[0]
+
+    snapshot.put(row(3))
+    assert snapshot.ordered("no")[0] is not rows and len(snapshot) == 3
+    snapshot.response(("list", 1), build)
+    assert len(builds) == 2
+    snapshot.remove(1)
+    assert snapshot.get(1) is None and [r.no for r in snapshot.ordered("no")[0]] == [2, 3]
+    # 없는 행 제거는 캐시를 비우지 않음
+    snapshot.response(("list", 1), build)
+    snapshot.remove(9)
+    snapshot.response(("list", 1), build)
+    assert len(builds) == 3
+
+
+def test_response_built_during_a_change_is_not_kept():
+    snapshot = FleetSnapshot()
+    snapshot.load([row(1)], 1)
+
+    def build():
+        # 응답을 만드는 사이 쓰기
+        snapshot.put(row(1, "B"))
+        return b"old"
+
+    assert snapshot.response("list", build) == b"old"
+    assert snapshot.response("list", lambda: b"new") == b"new"
+
+
+def test_response_cache_is_bounded():
+    snapshot = FleetSnapshot(max_responses=2)
+    snapshot.load([row(1)], 1)
+    for key in range(3):
+        snapshot.response(key, lambda: b"body")
+    assert len(snapshot._responses) <= 2
+
+
+def test_advance_follows_the_change_counter():
+    snapshot = FleetSnapshot()
+    assert not snapshot.loaded
+    snapshot.advance(1)
+    assert snapshot.stale
+    snapshot.load([row(1)], 5)
+    assert snapshot.version == 5 and not snapshot.stale and snapshot.loads == 1
+    snapshot.advance(6)
+    assert snapshot.version == 6 and not snapshot.stale
+    snapshot.advance(5)
+    assert not snapshot.stale
+    # 다른 워커의 쓰기로 건너뜀
+    snapshot.advance(8)
+    assert snapshot.version == 6 and snapshot.stale
+
+
+def test_writes_during_reload_are_replayed_and_leave_snapshot_stale():
+    snapshot = FleetSnapshot()
+    snapshot.load([row(1), row(2)], 3)
+    snapshot.begin_load()
+    loaded = [row(1), row(2)]  # DB에서 읽은 행
+    # 읽는 사이 이 프로세스의 쓰기
+    snapshot.put(row(3))
+    snapshot.remove(2)
+    snapshot.put(row(1, "B"))
+    snapshot.load(loaded, 4)
+    assert [r.no for r in snapshot.ordered("no")[0]] == [1, 3]
+    assert snapshot.get(1).values["main"] == "B"
+    assert snapshot.version == 4 and snapshot.stale
+
+    # 쓰기가 없던 읽기는 바로 최신
+    snapshot.begin_load()
+    snapshot.load(loaded, 5)
+    assert not snapshot.stale and len(snapshot) == 2
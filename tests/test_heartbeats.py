@@ -0,0 +1,42 @@
+from datetime import datetime
+
+from heartbeats import HeartbeatTable
+
+MAC_A = 0xAABBCCDDEE01
+MAC_B = 0xAABBCCDDEE02
+
+
+def test_heartbeats_coalesce_per_box():
+    table = HeartbeatTable()
+    table.record(MAC_A, datetime(2026, 10, 17, 9, 0, 0), "10.0.0.1")
+    table.record(MAC_A, datetime(2026, 10, 17, 9, 0, 5), None)
+    table.record(MAC_B, datetime(2026, 10, 17, 9, 0, 1), None)
+    table.record(MAC_A, datetime(2026, 10, 17, 9, 0, 9), None)
+    assert len(table) == 2
+    # IP 없이 온 heartbeat는 앞서 받은 IP를 유지
+    assert table.drain() == {
+        MAC_A: (datetime(2026, 10, 17, 9, 0, 9), "10.0.0.1"),
+        MAC_B: (datetime(2026, 10, 17, 9, 0, 1), None),
+    }
+    assert len(table) == 0 and table.drain() == {}
+
+
+def test_reported_ip_replaces_previous():
+    table = HeartbeatTable()
+    table.record(MAC_A, datetime(2026, 10, 17, 9), "10.0.0.1")
+    table.record(MAC_A, datetime(2026, 10, 17, 9, 1), "10.0.0.2")
+    assert table.drain()[MAC_A] == (datetime(2026, 10, 17, 9, 1), "10.0.0.2")
+
+
+def test_restore_keeps_newer_heartbeats():
+    table = HeartbeatTable()
+    table.record(MAC_A, datetime(2026, 10, 17, 9), "10.0.0.1")
+    table.record(MAC_B, datetime(2026, 10, 17, 9), "10.0.0.2")
+    pending = table.drain()
+    # flush하는 사이 받은 heartbeat
+    table.record(MAC_A, datetime(2026, 10, 17, 9, 1), "10.0.0.9")
+    table.restore(pending)
+    assert table.drain() == {
+        MAC_A: (datetime(2026, 10, 17, 9, 1), "10.0.0.9"),
+        MAC_B: (datetime(2026, 10, 17, 9), "10.0.0.2"),
+    }
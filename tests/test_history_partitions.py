@@ -0,0 +1,203 @@
+import re
+from datetime import date, datetime
+
+import pytest
+
+from history_partitions import (
+    MAXVALUE_PARTITION, Partition, PartitionStep, archive_partition, plan_partitions,
+)
+
+TABLE = "modification_history"
+TODAY = date(2026, 10, 17)
+
+
+def monthly(first: date, months: int, rows: int = 10):
+    """first 달부터 months개의 달 파티션과 MAXVALUE 파티션"""
+    partitions = []
+    year, month = first.year, first.month
+    for _ in range(months):
+        upper = date(year + month // 12, month % 12 + 1, 1)
+        partitions.append(Partition("p%04d%02d" % (year, month), upper, rows))
+        year, month = upper.year, upper.month
+    return partitions + [Partition(MAXVALUE_PARTITION, None, 0)]
+
+
+def test_partition_empty_table_from_this_month():
+    steps = plan_partitions(TABLE, [], None, TODAY, 2, 0, True)
+    assert [step.action for step in steps] == ["partition"]
+    update, alter = steps[0].sql
+    assert update.startswith("UPDATE %s SET modified_at = '1970-01-01'" % TABLE)
+    # 기본 키 변경과 분할이 ALTER 하나
+    assert alter == (
+        "ALTER TABLE modification_history MODIFY modified_at DATETIME NOT NULL, DROP PRIMARY KEY, "
+        "ADD PRIMARY KEY (id, modified_at) PARTITION BY RANGE COLUMNS(modified_at) ("
+        "PARTITION p202610 VALUES LESS THAN ('2026-11-01'), "
+        "PARTITION p202611 VALUES LESS THAN ('2026-12-01'), "
+        "PARTITION p202612 VALUES LESS THAN ('2027-01-01'), "
+        "PARTITION pmax VALUES LESS THAN (MAXVALUE))"
+    )
+
+
+def test_partition_existing_rows_with_null_modified_at():
+    steps = plan_partitions(TABLE, [], datetime(2025, 3, 9, 12), TODAY, 1, 12, True)
+    # 보관 기간 정리는 나눈 뒤 다시 계획 (분할 전에는 파티션 단위로 정리할 수 없음)
+    assert [step.action for step in steps] == ["partition"]
+    update, alter = steps[0].sql
+    assert update == "UPDATE modification_history SET modified_at = '1970-01-01' WHERE modified_at IS NULL"
+    bounds = re.findall(r"PARTITION (\w+) VALUES LESS THAN \('([\d-]+)'\)", alter)
+    # 가장 오래된 이력의 달부터 다음 달까지 (NULL이던 이력은 첫 파티션에 들어감)
+    assert bounds[0] == ("p202503", "2025-04-01")
+    assert bounds[-1] == ("p202611", "2026-12-01")
+    assert len(bounds) == 21
+    assert "1970-01-01" < bounds[0][1]
+
+
+def test_reorganize_maxvalue_for_months_ahead():
+    partitions = monthly(date(2026, 10, 1), 2)  # p202610, p202611, pmax
+    steps = plan_partitions(TABLE, partitions, None, date(2026, 12, 5), 1, 0, True)
+    assert steps == [PartitionStep("add", "p202612, p202701", 0, [
+        "ALTER TABLE modification_history REORGANIZE PARTITION pmax INTO ("
+        "PARTITION p202612 VALUES LESS THAN ('2027-01-01'), "
+        "PARTITION p202701 VALUES LESS THAN ('2027-02-01'), "
+        "PARTITION pmax VALUES LESS THAN (MAXVALUE))"
+    ])]
+    # 이미 앞서 만들어 두었으면 할 일 없음
+    assert plan_partitions(TABLE, monthly(date(2026, 10, 1), 4), None, date(2026, 12, 5), 1, 0, True) == []
+
+
+def test_add_partition_without_maxvalue():
+    partitions = monthly(date(2026, 10, 1), 2)[:-1]
+    steps = plan_partitions(TABLE, partitions, None, date(2026, 12, 5), 0, 0, True)
+    assert steps == [PartitionStep("add", "p202612", 0, [
+        "ALTER TABLE modification_history ADD PARTITION (PARTITION p202612 VALUES LESS THAN ('2027-01-01'))"
+    ])]
+
+
+@pytest.mark.parametrize("archive", [False, True])
+def test_retention_drops_or_archives_expired_months(archive):
+    partitions = monthly(date(2025, 8, 1), 17, rows=7)  # p202508 ~ p202612, pmax
+    steps = plan_partitions(TABLE, partitions, None, TODAY, 2, 12, archive)
+    # 경계가 2025-10-01(이번 달 1일의 12개월 전) 이하인 파티션만
+    assert [(step.action, step.partition, step.rows) for step in steps] == [
+        ("archive" if archive else "drop", "p202508", 7),
+        ("archive" if archive else "drop", "p202509", 7),
+    ]
+    if archive:
+        assert steps[0].sql == [
+            "CREATE TABLE IF NOT EXISTS modification_history_archive_202508 LIKE modification_history",
+            "ALTER TABLE modification_history_archive_202508 REMOVE PARTITIONING",
+            "ALTER TABLE modification_history EXCHANGE PARTITION p202508 WITH TABLE modification_history_archive_202508",
+            "ALTER TABLE modification_history DROP PARTITION p202508",
+        ]
+    else:
+        assert steps[0].sql == ["ALTER TABLE modification_history DROP PARTITION p202508"]
+
+
+def test_retention_keeps_this_month_and_maxvalue():
+    steps = plan_partitions(TABLE, monthly(date(2026, 8, 1), 5), None, TODAY, 2, 1, False)
+    assert [step.partition for step in steps] == ["p202608"]
+
+
+class Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeConnection:
+    """archive_partition이 실행하는 조회와 DDL만 흉내 내는 연결
+
+    tables: 테이블 이름 -> {"partitions": {파티션: 행 수} 또는 None(분할 안 됨), "rows": 행 수}
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.ddl = []
+
+    def execute(self, statement, parameters=None):
+        sql = str(statement)
+        if "information_schema.PARTITIONS" in sql:
+            table = self.tables.get(parameters["table"])
+            if table is None or table["partitions"] is None:
+                return Result([(None, None, None, table and table["rows"])])
+            return Result([
+                (name, "RANGE COLUMNS", "MAXVALUE", rows) for name, rows in table["partitions"].items()
+            ])
+        match = re.match(r"SELECT 1 FROM (\w+)(?: PARTITION \((\w+)\))? LIMIT 1", sql)
+        if match:
+            table = self.tables[match.group(1)]
+            rows = table["partitions"][match.group(2)] if match.group(2) else table["rows"]
+            return Result([(1,)] if rows else [])
+        self.ddl.append(sql)
+        match = re.match(r"CREATE TABLE IF NOT EXISTS (\w+) LIKE (\w+)", sql)
+        if match:
+            source = self.tables[match.group(2)]["partitions"]
+            self.tables.setdefault(match.group(1), {"partitions": dict.fromkeys(source, 0), "rows": 0})
+            return Result([])
+        match = re.match(r"ALTER TABLE (\w+) REMOVE PARTITIONING", sql)
+        if match:
+            self.tables[match.group(1)]["partitions"] = None
+            return Result([])
+        match = re.match(r"ALTER TABLE (\w+) EXCHANGE PARTITION (\w+) WITH TABLE (\w+)", sql)
+        if match:
+            partitions, target = self.tables[match.group(1)]["partitions"], self.tables[match.group(3)]
+            partitions[match.group(2)], target["rows"] = target["rows"], partitions[match.group(2)]
+            return Result([])
+        match = re.match(r"ALTER TABLE (\w+) DROP PARTITION (\w+)", sql)
+        if match:
+            del self.tables[match.group(1)]["partitions"][match.group(2)]
+            return Result([])
+        raise AssertionError(sql)
+
+
+ARCHIVE = "modification_history_archive_202508"
+
+
+def archive_step():
+    return plan_partitions(TABLE, monthly(date(2025, 8, 1), 17), None, TODAY, 2, 13, True)[0]
+
+
+def history_table(expired_rows: int):
+    return {"partitions": {"p202508": expired_rows, "p202509": 10, MAXVALUE_PARTITION: 0}, "rows": expired_rows + 10}
+
+
+def test_archive_moves_partition_rows_then_drops():
+    conn = FakeConnection({TABLE: history_table(5)})
+    archive_partition(conn, TABLE, archive_step())
+    assert conn.ddl == archive_step().sql
+    assert conn.tables[ARCHIVE] == {"partitions": None, "rows": 5}
+    assert "p202508" not in conn.tables[TABLE]["partitions"]
+
+
+def test_archive_rerun_after_exchange_only_drops():
+    # 지난 실행이 EXCHANGE 뒤에 멈춤: 보관 테이블에 이력이 있고 파티션은 비어 있음
+    conn = FakeConnection({TABLE: history_table(0), ARCHIVE: {"partitions": None, "rows": 5}})
+    archive_partition(conn, TABLE, archive_step())
+    create, _, _, drop = archive_step().sql
+    assert conn.ddl == [create, drop]
+    assert conn.tables[ARCHIVE] == {"partitions": None, "rows": 5}
+
+
+def test_archive_rerun_after_create_continues():
+    # 지난 실행이 CREATE 뒤에 멈춤: 보관 테이블이 아직 분할된 채 비어 있음
+    conn = FakeConnection({
+        TABLE: history_table(5),
+        ARCHIVE: {"partitions": {"p202508": 0, "p202509": 0, MAXVALUE_PARTITION: 0}, "rows": 0},
+    })
+    archive_partition(conn, TABLE, archive_step())
+    assert conn.ddl == archive_step().sql
+    assert conn.tables[ARCHIVE] == {"partitions": None, "rows": 5}
+
+
+def test_archive_refuses_to_overwrite_archived_rows():
+    conn = FakeConnection({TABLE: history_table(5), ARCHIVE: {"partitions": None, "rows": 3}})
+    with pytest.raises(RuntimeError):
+        archive_partition(conn, TABLE, archive_step())
+    create = archive_step().sql[0]
+    assert conn.ddl == [create]
+    assert conn.tables[TABLE]["partitions"]["p202508"] == 5
@@ -0,0 +1,33 @@
+import pytest
+from fastapi import HTTPException
+
+from keyset import decode_cursor, encode_cursor
+
+
+@pytest.mark.parametrize("values", [
+    {"no": 42},
+    {"updated_at": "2026-10-17T09:00:05.250000", "no": 7},
+    {"main": "검사기 A15A", "no": 3},
+    {"main": None, "no": 1},
+    {},
+])
+def test_cursor_round_trip(values):
+    cursor = encode_cursor(values)
+    # URL 쿼리에 그대로 넣을 수 있도록 패딩 없는 urlsafe base64
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor) == values
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",        # base64 문자가 아님
+    "a",                    # 길이가 맞지 않음
+    "커서",                  # ASCII가 아님
+    encode_cursor([1, 2]),  # 객체가 아님
+    encode_cursor(42),
+    "bm90IGpzb24",          # "not json"
+    "_-8",                  # UTF-8이 아닌 바이트
+])
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
@@ -0,0 +1,78 @@
+import pytest
+
+import response_cache
+from response_cache import ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entry_is_found_by_every_key(clock):
+    cache = ResponseCache(maxsize=8, ttl=30)
+    cache.put([("no", 1), ("mac", "AA")], b"box1")
+    assert cache.get(("no", 1)) == b"box1"
+    assert cache.get(("mac", "AA")) == b"box1"
+    assert cache.get(("no", 2)) is None
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_evict_by_any_key_removes_all_keys(clock):
+    cache = ResponseCache(maxsize=8, ttl=30)
+    cache.put([("no", 1), ("mac", "AA")], b"box1")
+    cache.evict(("mac", "AA"))
+    assert cache.get(("no", 1)) is None and len(cache) == 0
+    assert cache.stats()["evictions"] == 1
+
+
+def test_put_replaces_entries_sharing_a_key(clock):
+    cache = ResponseCache(maxsize=8, ttl=30)
+    cache.put([("no", 1), ("mac", "AA")], b"old")
+    # MAC이 바뀐 같은 장비
+    cache.put([("no", 1), ("mac", "BB")], b"new")
+    assert cache.get(("no", 1)) == b"new"
+    assert cache.get(("mac", "AA")) is None
+    assert len(cache) == 1
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(maxsize=8, ttl=30)
+    cache.put([("no", 1)], b"box1")
+    clock[0] += 29.9
+    assert cache.get(("no", 1)) == b"box1"
+    clock[0] += 0.1
+    assert cache.get(("no", 1)) is None
+    assert cache.stats()["expirations"] == 1 and len(cache) == 0
+
+
+def test_least_recently_used_entry_is_dropped(clock):
+    cache = ResponseCache(maxsize=2, ttl=30)
+    cache.put([("no", 1)], b"box1")
+    cache.put([("no", 2)], b"box2")
+    cache.get(("no", 1))
+    cache.put([("no", 3)], b"box3")
+    assert cache.get(("no", 2)) is None
+    assert cache.get(("no", 1)) == b"box1" and cache.get(("no", 3)) == b"box3"
+    assert cache.stats()["capacity_evictions"] == 1
+
+
+def test_put_after_write_with_old_generation_is_skipped(clock):
+    cache = ResponseCache(maxsize=8, ttl=30)
+    generation = cache.generation
+    # DB를 읽는 사이 다른 요청이 쓰기 후 제거
+    cache.evict(("no", 1))
+    cache.put([("no", 1)], b"stale", generation)
+    assert cache.get(("no", 1)) is None
+    cache.put([("no", 1)], b"fresh", cache.generation)
+    assert cache.get(("no", 1)) == b"fresh"
+    cache.clear()
+    assert cache.get(("no", 1)) is None and cache.generation == generation + 2
+
+
+def test_zero_maxsize_disables_cache(clock):
+    cache = ResponseCache(maxsize=0, ttl=30)
+    cache.put([("no", 1)], b"box1")
+    assert cache.get(("no", 1)) is None and len(cache) == 0
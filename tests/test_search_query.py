@@ -0,0 +1,62 @@
+import pytest
+
+from search_query import (
+    ParsedQuery, QualifiedTerm, boolean_query, is_complete_value, like_prefix, parse_query, split_terms,
+)
+
+
+@pytest.mark.parametrize("q, mac_prefixes, ip_prefixes, words", [
+    ("AA:BB:CC", ["AA:BB:CC"], [], []),
+    ("aa-bb-cc-", ["AA:BB:CC:"], [], []),
+    ("10.2. A15A", [], ["10.2."], ["A15A"]),
+    ("192.168.0.1", [], ["192.168.0.1"], []),
+    ("AA", [], [], ["AA"]),          # 한 바이트는 MAC 조각으로 보지 않음
+    ("10", [], [], ["10"]),
+    ("+PKG -test \"A15A\" (x)", [], [], ["PKG", "test", "A15A", "x"]),
+    ("foo-bar", [], [], ["foo", "bar"]),
+    ("***", [], [], []),
+])
+def test_split_terms(q, mac_prefixes, ip_prefixes, words):
+    terms = split_terms(q)
+    assert terms.mac_prefixes == mac_prefixes
+    assert terms.ip_prefixes == ip_prefixes
+    assert terms.words == words
+
+
+def test_like_prefix_escapes_wildcards():
+    assert like_prefix("10.2.") == "10.2.%"
+    assert like_prefix("50%_a/b") == "50/%/_a//b%"
+
+
+def test_boolean_query_requires_every_word_prefix():
+    assert boolean_query(["PKG", "A15A"]) == "+PKG* +A15A*"
+    assert boolean_query([]) == ""
+
+
+@pytest.mark.parametrize("q, terms, free_text", [
+    ("mac:AA:BB:CC", [QualifiedTerm("mac", "AA:BB:CC", False)], ""),
+    ("process:PKG A15A", [QualifiedTerm("process", "PKG", False)], "A15A"),
+    ('modifier:"장민오" main:"A15A 2"', [QualifiedTerm("modifier", "장민오", True), QualifiedTerm("main", "A15A 2", True)], ""),
+    ("IP:10.2. 검사", [QualifiedTerm("ip", "10.2.", False)], "검사"),
+    # 지원하지 않는 필드는 자유 검색어로 남김
+    ("notice:점검 x", [], "notice:점검 x"),
+    ('"two words" mac:', [], "two words mac:"),
+    # 빈 값은 조건으로 보지 않음
+    ('main:"" PKG', [], "PKG"),
+    ("", [], ""),
+])
+def test_parse_query_splits_field_qualified_terms(q, terms, free_text):
+    assert parse_query(q) == ParsedQuery(terms, free_text)
+
+
+@pytest.mark.parametrize("field, value, complete", [
+    ("mac", "AA:BB:CC:DD:EE:FF", True),
+    ("mac", "AA:BB:CC:DD:EE:", False),
+    ("mac", "AA:BB:CC", False),
+    ("ip", "10.0.0.1", True),
+    ("ip", "10.0.0.", False),
+    ("ip", "10.0.0", False),
+    ("main", "A15A", False),
+])
+def test_is_complete_value(field, value, complete):
+    assert is_complete_value(field, value) is complete
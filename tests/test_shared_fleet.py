@@ -0,0 +1,195 @@
+import json
+import multiprocessing
+import time
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fcntl")  # 공유 테이블은 Linux/Unix 전용
+
+from fleet_snapshot import SnapshotRow  # noqa: E402
+from shared_fleet import SharedFleetFull, SharedFleetTable  # noqa: E402
+
+
+def ip_bin(no: int) -> bytes:
+    return bytes(10) + b"\xff\xff" + bytes([10, 0, 0, no])
+
+
+def make_row(no: int, main: str = "A15A", last_seen=None, updated_at=datetime(2026, 10, 1)):
+    values = {
+        "no": no,
+        "mac": "AA:BB:CC:DD:EE:%02X" % no,
+        "ip": "10.0.0.%d" % no,
+        "main": main,
+        "process": "PKG",
+        "modifier": "tester",
+        "updated_at": updated_at,
+        "last_seen": last_seen,
+    }
+    body = dict(values, updated_at=updated_at.isoformat(), last_seen=last_seen and last_seen.isoformat())
+    values.update(
+        mac_int=0xAABBCCDDEE00 + no,
+        ip_bin=ip_bin(no),
+        search_text="\x00".join(str(values[field]).lower() for field in ("mac", "ip", "main", "process")),
+    )
+    return SnapshotRow(no, values, json.dumps(body, separators=(",", ":")).encode())
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "fleet")
+
+
+@pytest.fixture
+def table(path):
+    table = SharedFleetTable(path, capacity=16, arena_size=64 * 1024)
+    yield table
+    table.close()
+
+
+def test_publish_get_round_trip(table):
+    rows = [make_row(3, updated_at=datetime(2026, 10, 3)), make_row(1, updated_at=datetime(2026, 10, 5)),
+            make_row(2, updated_at=datetime(2026, 10, 4))]
+    assert not table.loaded
+    assert table.publish(rows, 7)
+    assert table.loaded and table.version == 7 and len(table) == 3
+    # 같은 version은 다시 쓰지 않음
+    assert not table.publish(rows, 7)
+
+    row = table.get(2)
+    assert json.loads(row.json) == json.loads(rows[2].json)
+    assert row.values["main"] == "A15A" and row.values["mac_int"] == 0xAABBCCDDEE02
+    assert row.values["ip_bin"] == ip_bin(2) and row.values["updated_at"] == datetime(2026, 10, 4)
+    assert table.get_by_mac(0xAABBCCDDEE01).no == 1
+    assert table.get(9) is None
+    assert [row.no for row in table.ordered("no")[0]] == [1, 2, 3]
+    assert [row.no for row in table.ordered("updated_at")[0]] == [3, 2, 1]
+
+    table.put(make_row(2, main="B20B", updated_at=datetime(2026, 10, 6)))
+    table.remove(1)
+    assert table.get(2).values["main"] == "B20B" and table.get(1) is None
+    assert [row.no for row in table.ordered("updated_at")[0]] == [3, 2]
+
+
+def open_and_check(path: str):
+    """다른 워커 프로세스에서 열면 게시된 내용을 그대로 봄"""
+    table = SharedFleetTable(path, capacity=16, arena_size=64 * 1024)
+    ok = table.loaded and table.get(1) is not None
+    table.close()
+    raise SystemExit(0 if ok else 1)
+
+
+def test_second_process_shares_and_leftover_file_is_reset(path):
+    first = SharedFleetTable(path, capacity=16, arena_size=64 * 1024)
+    first.publish([make_row(1)], 1)
+    # 파일 잠금(lockf)은 프로세스 단위이므로 실제 다른 프로세스에서 확인
+    second = multiprocessing.get_context("fork").Process(target=open_and_check, args=(path,))
+    second.start()
+    second.join(10)
+    assert second.exitcode == 0
+    first.close()
+    # 열어 둔 프로세스가 없으면 이전 실행에서 남은 파일이므로 비움
+    reopened = SharedFleetTable(path, capacity=16, arena_size=64 * 1024)
+    assert not reopened.loaded and reopened.get(1) is None
+    reopened.close()
+
+
+def test_set_last_seen_patches_only_the_json_field(table):
+    table.publish([make_row(1, last_seen=datetime(2026, 10, 17, 9)), make_row(2)], 1)
+    before = table.get(1)
+    arena_used = table._header()[8]
+
+    table.set_last_seen([(1, datetime(2026, 10, 17, 9, 0, 5, 250000)), (2, datetime(2026, 10, 17, 9, 1))])
+    after = table.get(1)
+    assert json.loads(after.json)["last_seen"] == "2026-10-17T09:00:05.250000"
+    assert json.loads(table.get(2).json)["last_seen"] == "2026-10-17T09:01:00"
+    # 응답 JSON의 나머지와 컬럼 값은 그대로, 문자열 영역도 쓰지 않음
+    start = before.json.index(b'"last_seen":')
+    assert after.json[:start] == before.json[:start]
+    assert after.values == before.values
+    assert table._header()[8] == arena_used
+
+    # 더 오래된 heartbeat는 반영하지 않음
+    table.set_last_seen([(1, datetime(2026, 10, 17, 8, 59))])
+    assert json.loads(table.get(1).json)["last_seen"] == "2026-10-17T09:00:05.250000"
+
+
+def test_full_table_raises_and_invalidate_unpublishes(path):
+    table = SharedFleetTable(path, capacity=2, arena_size=64 * 1024)
+    try:
+        table.publish([make_row(1), make_row(2)], 1)
+        with pytest.raises(SharedFleetFull):
+            table.put(make_row(3))
+        # 앱은 SharedFleetFull이면 invalidate로 게시를 해제해 DB로 응답함
+        table.invalidate()
+        assert not table.loaded
+        assert table.publish([make_row(1)], 2)
+        assert table.loaded
+
+        with pytest.raises(SharedFleetFull):
+            table.publish([make_row(1), make_row(2), make_row(3)], 3)
+        assert not table.loaded
+    finally:
+        table.close()
+
+
+def test_full_arena_compacts_then_raises(path):
+    table = SharedFleetTable(path, capacity=4, arena_size=4096)
+    try:
+        table.publish([make_row(1)], 1)
+        # 같은 행을 여러 번 다시 쓰면 압축으로 공간을 되찾음
+        for i in range(20):
+            table.put(make_row(1, main="x" * 500 + str(i)))
+        assert table.get(1).values["main"].endswith("19")
+        with pytest.raises(SharedFleetFull):
+            table.put(make_row(2, main="x" * 5000))
+    finally:
+        table.close()
+
+
+def rewrite_row(path: str, stop):
+    """다른 워커처럼 같은 파일을 열어 한 행을 계속 다시 씁니다 (응답 JSON과 main 값은 늘 같음)"""
+    table = SharedFleetTable(path, capacity=16, arena_size=4 * 1024 * 1024)
+    i = 0
+    while not stop.is_set():
+        i += 1
+        # 길이가 다른 값을 써서 쓰기마다 걸리는 시간과 문자열 위치가 달라지게 함
+        table.put(make_row(1, main="M%07d" % i + "p" * (i % 4000)))
+    table.close()
+
+
+def test_reader_retries_across_concurrent_writer(path):
+    table = SharedFleetTable(path, capacity=16, arena_size=4 * 1024 * 1024)
+    table.publish([make_row(1, main="M0000000")], 1)
+    attempts = 0
+    read = table._read
+
+    def counting_read(function):
+        def counted():
+            nonlocal attempts
+            attempts += 1
+            return function()
+        return read(counted)
+
+    table._read = counting_read
+    context = multiprocessing.get_context("fork")
+    stop = context.Event()
+    writer = context.Process(target=rewrite_row, args=(path, stop))
+    writer.start()
+    try:
+        reads = 0
+        seen = set()
+        deadline = time.monotonic() + 20
+        while (attempts == reads or len(seen) < 100) and time.monotonic() < deadline:
+            row = table.get(1)
+            reads += 1
+            # 쓰는 도중의 행이 섞여 보이면 응답 JSON과 컬럼 값이 어긋남
+            assert json.loads(row.json)["main"] == row.values["main"]
+            seen.add(row.values["main"])
+        assert attempts > reads, "쓰기와 겹친 읽기가 없었습니다"
+        assert len(seen) >= 100
+    finally:
+        stop.set()
+        writer.join(10)
+        table.close()
+    assert writer.exitcode == 0
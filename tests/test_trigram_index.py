@@ -0,0 +1,97 @@
+import pytest
+
+from trigram_index import TrigramIndex, trigrams
+
+
+@pytest.fixture
+def index():
+    index = TrigramIndex()
+    index.rebuild([
+        (1, ["AA:BB:CC:00:00:01", "10.0.0.1", "A15A", "PKG"]),
+        (2, ["AA:BB:CC:00:00:02", "10.0.0.12", "B20B", None]),
+        (3, ["DD:EE:FF:00:00:03", "192.168.0.3", "a15a-spare", "TEST"]),
+    ], 5)
+    return index
+
+
+def test_trigrams():
+    assert trigrams("abcd") == {"abc", "bcd"}
+    assert trigrams("ab") == set()
+
+
+def test_search_is_case_insensitive_substring(index):
+    assert index.search("a15a") == [1, 3]
+    assert index.search("10.0.0.1") == [1, 2]
+    assert index.search("10.0.0.12") == [2]
+    assert index.search("spare") == [3]
+    assert index.search("nothing") == []
+    assert index.search("10.0.0", limit=1) == [1]
+
+
+def test_search_does_not_match_across_fields(index):
+    # 필드 경계를 넘는 문자열 ("...:01" + "10...")
+    assert index.search("0110") == []
+    assert index.search("pkg") == [1]
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("a", [1, 2, 3]),    # "aa:bb", "a15a"
+    ("Aa", [1, 2]),
+    ("12", [2]),
+    ("pk", [1]),
+    ("zz", []),
+    ("", [1, 2, 3]),
+])
+def test_queries_under_three_characters_scan_documents(index, query, expected):
+    assert index.search(query) == expected
+
+
+def test_add_replaces_and_remove_deletes(index):
+    index.add(2, ["AA:BB:CC:00:00:02", "10.0.0.99", "C30C", None])
+    assert index.search("10.0.0.12") == []
+    assert index.search("c30c") == [2]
+    assert index.search("b2") == []
+    index.remove(1)
+    assert index.search("a15a") == [3]
+    index.remove(9)
+    assert len(index) == 2
+
+
+def test_advance_follows_the_change_counter():
+    index = TrigramIndex()
+    assert not index.loaded and not index.current
+    index.advance(1)
+    assert not index.current
+    index.rebuild([(1, ["A15A"])], 5)
+    assert index.current and index.version == 5
+    # 이 프로세스의 다음 값만 따라감
+    index.advance(6)
+    assert index.current and index.version == 6
+    index.advance(6)
+    assert index.current
+    # 다른 워커의 쓰기로 건너뛰면 다시 구성할 때까지 stale
+    index.advance(8)
+    assert index.loaded and not index.current and index.version == 6
+    index.rebuild([(1, ["A15A"])], 8)
+    assert index.current
+
+
+def test_writes_during_rebuild_are_replayed_and_leave_index_stale():
+    index = TrigramIndex()
+    index.rebuild([(1, ["A15A"]), (2, ["B20B"])], 3)
+    index.begin_load()
+    rows = [(1, ["A15A"]), (2, ["B20B"])]  # DB에서 읽은 행
+    # 읽는 사이 이 프로세스의 쓰기
+    index.add(3, ["C30C"])
+    index.remove(2)
+    index.add(1, ["A15X"])
+    index.rebuild(rows, 4)
+    assert index.search("c30c") == [3]
+    assert index.search("b20b") == []
+    assert index.search("a15") == [1] and index.search("a15a") == []
+    assert index.version == 4 and not index.current
+
+    # 쓰기가 없던 구성은 바로 current
+    index.begin_load()
+    index.rebuild(rows, 5)
+    assert index.current and index.search("b20b") == [2]
@@ -0,0 +1,131 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 필드 사이 구분자 - 검색어에는 나올 수 없으므로 필드 경계를 넘는 매치가 생기지 않음
+FIELD_SEPARATOR = "\x00"
+
+
+def trigrams(text: str) -> Set[str]:
+    """문자열의 3글자 조각 집합"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """여러 컬럼 문자열에 대한 프로세스 내 트라이그램 역색인
+
+    부분 문자열 검색은 검색어의 트라이그램별 posting list를 교집합한 뒤
+    후보 문서에서만 실제 포함 여부를 확인합니다. 대소문자는 구분하지 않습니다.
+    version은 FleetSnapshot과 같이 색인이 반영한 DB 변경 카운터 값으로, 다른 워커의 쓰기로
+    카운터가 건너뛰면 stale이 되어 다시 구성해야 합니다. 다시 구성하는 동안(begin_load 이후
+    rebuild 전)의 add/remove는 기록해 두었다가 읽은 행 위에 다시 반영합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._docs: Dict[int, str] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self.version: Optional[int] = None  # None이면 아직 구성하지 않음
+        self.stale = False
+        self._pending: Optional[List[Tuple[int, Optional[str]]]] = None  # 구성하는 동안의 (key, 문서 또는 삭제)
+
+    def __len__(self):
+        return len(self._docs)
+
+    @property
+    def loaded(self) -> bool:
+        return self.version is not None
+
+    @property
+    def current(self) -> bool:
+        """구성했고 이후 다른 워커의 쓰기로 뒤처지지 않았는지"""
+        return self.version is not None and not self.stale
+
+    @staticmethod
+    def _document(values: Iterable[Optional[str]]) -> str:
+        return FIELD_SEPARATOR.join(value.lower() for value in values if value)
+
+    @staticmethod
+    def _insert(docs: Dict[int, str], postings: Dict[str, Set[int]], key: int, doc: str):
+        docs[key] = doc
+        for gram in trigrams(doc):
+            postings.setdefault(gram, set()).add(key)
+
+    @staticmethod
+    def _discard(docs: Dict[int, str], postings: Dict[str, Set[int]], key: int):
+        doc = docs.pop(key, None)
+        if doc is None:
+            return
+        for gram in trigrams(doc):
+            posting = postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del postings[gram]
+
+    def add(self, key: int, values: Iterable[Optional[str]]):
+        """문서를 추가하거나 교체합니다"""
+        doc = self._document(values)
+        with self._lock:
+            self._discard(self._docs, self._postings, key)
+            self._insert(self._docs, self._postings, key, doc)
+            if self._pending is not None:
+                self._pending.append((key, doc))
+
+    def remove(self, key: int):
+        """문서를 색인에서 제거합니다"""
+        with self._lock:
+            self._discard(self._docs, self._postings, key)
+            if self._pending is not None:
+                self._pending.append((key, None))
+
+    def begin_load(self):
+        """DB에서 변경 카운터와 행을 읽기 직전에 호출합니다 (이후의 add/remove를 기록)"""
+        with self._lock:
+            self._pending = []
+
+    def rebuild(self, rows: Iterable[Tuple[int, Iterable[Optional[str]]]], version: int):
+        """(key, values) 목록과 함께 읽은 변경 카운터 값으로 색인 전체를 다시 구성합니다
+
+        begin_load 이후의 add/remove를 다시 반영하고, 그런 쓰기가 있었으면 읽은 행보다 오래된
+        값일 수 있으므로 stale로 두어 다음 확인 때 한 번 더 구성하게 합니다.
+        """
+        docs: Dict[int, str] = {}
+        postings: Dict[str, Set[int]] = {}
+        for key, values in rows:
+            self._insert(docs, postings, key, self._document(values))
+        with self._lock:
+            pending, self._pending = self._pending or [], None
+            for key, doc in pending:
+                self._discard(docs, postings, key)
+                if doc is not None:
+                    self._insert(docs, postings, key, doc)
+            self._docs = docs
+            self._postings = postings
+            self.version = version
+            self.stale = bool(pending)
+
+    def advance(self, version: int):
+        """이 프로세스의 쓰기로 올라간 변경 카운터 값을 기록합니다 (건너뛰면 stale)"""
+        with self._lock:
+            if self.version is not None and version == self.version + 1:
+                self.version = version
+            elif self.version is None or version > self.version:
+                self.stale = True
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """query를 부분 문자열로 포함하는 문서 key 목록 (key 오름차순)"""
+        needle = query.lower()
+        with self._lock:
+            grams = trigrams(needle)
+            if grams:
+                postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+                candidates = set(postings[0])
+                for posting in postings[1:]:
+                    if not candidates:
+                        break
+                    candidates &= posting
+            else:
+                # 3글자 미만 검색어는 트라이그램이 없으므로 메모리의 문서를 직접 확인
+                candidates = self._docs.keys()
+            hits = sorted(key for key in candidates if needle in self._docs[key])
+        return hits if limit is None else hits[:limit]